@@ -36,6 +36,7 @@ def get_data_dir() -> Path:
     return DEFAULT_DATA_DIR.expanduser().resolve()
 
 
+@lru_cache(maxsize=None)
 def get_path(*subdirs: str) -> Path:
     """
     Get path relative to data directory.
@@ -20,16 +20,78 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import io
+import os
+import re
 import json
-import argparse
 import sys
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, List, NamedTuple, Optional, TextIO, Tuple, Union
 
 # Directories
 from config import get_data_dir, get_path
 
+# orjson is optional - faster JSON (de)serialization when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to 2-space indented JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    # Match orjson: keep unicode as-is, and skip the cycle bookkeeping for
+    # profiles that came straight from JSON files (and so can't be cyclic)
+    return json.dumps(obj, indent=2, ensure_ascii=False, check_circular=False)
+
+
+def _dump(obj: Any, fh: TextIO) -> None:
+    """Write 2-space indented JSON to fh; stdlib json streams it in chunks."""
+    if ORJSON_AVAILABLE:
+        fh.write(_dumps(obj))
+    else:
+        json.dump(obj, fh, indent=2, ensure_ascii=False, check_circular=False)
+
+
+@lru_cache(maxsize=8)
+def _read_json_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Any, bytes]:
+    """Parse a JSON file once per (path, mtime, size) so repeat loads skip the decode."""
+    raw_bytes = Path(path_str).read_bytes()
+    return _loads(raw_bytes), raw_bytes
+
+
+def _read_json(path: Path) -> Tuple[Any, bytes]:
+    """
+    Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    Returns:
+        Tuple of (parsed data, raw file bytes). The parsed data is shared
+        between callers and must not be mutated.
+    """
+    stat = path.stat()
+    return _read_json_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _try_read_json(path: Path) -> Optional[Any]:
+    """Load a JSON file, or return None if it is missing or unreadable."""
+    try:
+        return _read_json(path)[0]
+    except (OSError, ValueError):
+        return None
+
+
 DATA_DIR = get_data_dir()
 PERSONA_REGISTRY_FILE = get_path("persona_registry.json")
 LINKEDIN_PERSONA_FILE = get_path("linkedin_persona.json")
@@ -37,14 +99,70 @@ VALIDATION_FEEDBACK_FILE = get_path("validation_feedback.json")
 VALIDATION_REPORT_FILE = get_path("validation_report.json")
 SAMPLES_DIR = get_path("samples")
 
+# Skill names: letters, numbers, hyphens, underscores - with at least one letter or number
+_NAME_RE = re.compile(r'\A[\w-]*[^\W_][\w-]*\Z', re.ASCII)
+
+TONE_KEYS = ('formality', 'warmth', 'authority', 'directness')
+_CHAR_KEYS = TONE_KEYS + ('typical_greeting', 'typical_closing', 'uses_contractions', 'tone')
+_CHAR_DEFAULTS = dict.fromkeys(_CHAR_KEYS)
+_get_characteristics = itemgetter(*_CHAR_KEYS)
+
+# (short label for SKILL.md, row label for email_personas.md) per tone key
+_TONE_LABELS = tuple((key[:4].title(), key.title()) for key in TONE_KEYS)
+
+_PERSONA_TABLE_HEADER = (
+    "| Persona | Trigger | Tone Profile |\n"
+    "|---------|---------|-------------|\n"
+)
+
+
+class PersonaView(NamedTuple):
+    """Display strings for a persona's characteristics, shared by the markdown generators."""
+    tone_str: str
+    rows: Tuple[Tuple[str, str], ...]
+    greeting: str
+    closing: str
+    contractions: str
+    descriptors: str
+
+
+def _or_na(val: Any) -> str:
+    """Format a characteristic value, showing N/A when it's missing."""
+    return 'N/A' if val is None else str(val)
+
+
+def _trunc(text: str, limit: int, suffix: str = '...') -> str:
+    """Cut text to `limit` characters, appending suffix only if something was cut."""
+    return text if len(text) <= limit else text[:limit] + suffix
+
+
+def _summarize_characteristics(chars: Dict[str, Any]) -> PersonaView:
+    """Render a persona's characteristics dict once for both SKILL.md and email_personas.md."""
+    # One itemgetter call pulls every key; missing ones come back as None
+    values = _get_characteristics({**_CHAR_DEFAULTS, **chars})
+    tone_values = values[:len(TONE_KEYS)]
+    greeting, closing, contractions, tone = values[len(TONE_KEYS):]
+
+    tone_str = ", ".join(
+        f"{short}: {val}"
+        for (short, _), val in zip(_TONE_LABELS, tone_values) if val is not None
+    )
+    return PersonaView(
+        tone_str=tone_str or "See details",
+        rows=tuple((label, _or_na(val)) for (_, label), val in zip(_TONE_LABELS, tone_values)),
+        greeting=_or_na(greeting),
+        closing=_or_na(closing),
+        contractions=_or_na(contractions),
+        descriptors=', '.join(tone) if tone else ''
+    )
+
 
 def load_email_personas() -> List[Dict]:
     """Load email personas from persona_registry.json."""
     if not PERSONA_REGISTRY_FILE.exists():
         return []
 
-    with open(PERSONA_REGISTRY_FILE) as f:
-        data = json.load(f)
+    data, _ = _read_json(PERSONA_REGISTRY_FILE)
 
     personas_dict = data.get('personas', {})
     personas_list = []
@@ -61,13 +179,22 @@ def load_email_personas() -> List[Dict]:
     return personas_list
 
 
-def load_linkedin_persona() -> Optional[Dict]:
-    """Load LinkedIn persona if it exists."""
+def load_linkedin_persona_raw() -> Tuple[Optional[Dict], Optional[bytes]]:
+    """
+    Load LinkedIn persona along with the raw file bytes.
+
+    The raw bytes let generate_linkedin_voice_md embed the file as-is
+    instead of re-encoding the parsed profile.
+    """
     if not LINKEDIN_PERSONA_FILE.exists():
-        return None
+        return None, None
 
-    with open(LINKEDIN_PERSONA_FILE) as f:
-        return json.load(f)
+    return _read_json(LINKEDIN_PERSONA_FILE)
+
+
+def load_linkedin_persona() -> Optional[Dict]:
+    """Load LinkedIn persona if it exists."""
+    return load_linkedin_persona_raw()[0]
 
 
 def check_validation_complete() -> Dict:
@@ -85,63 +212,129 @@ def check_validation_complete() -> Dict:
     }
 
     # Check Phase 1 (automatic validation)
-    if VALIDATION_REPORT_FILE.exists():
-        try:
-            with open(VALIDATION_REPORT_FILE) as f:
-                report = json.load(f)
-            result["phase1_complete"] = True
-            result["score"] = report.get("summary", {}).get("overall_score")
-        except (json.JSONDecodeError, IOError):
-            pass
+    report = _try_read_json(VALIDATION_REPORT_FILE)
+    if report is not None:
+        result["phase1_complete"] = True
+        result["score"] = report.get("summary", {}).get("overall_score")
 
     # Check Phase 2 (interactive validation)
-    if VALIDATION_FEEDBACK_FILE.exists():
-        try:
-            with open(VALIDATION_FEEDBACK_FILE) as f:
-                feedback = json.load(f)
-            result["feedback_count"] = len(feedback.get("feedback", []))
-            result["phase2_complete"] = feedback.get("interactive_complete", False)
-        except (json.JSONDecodeError, IOError):
-            pass
+    feedback = _try_read_json(VALIDATION_FEEDBACK_FILE)
+    if feedback is not None:
+        result["feedback_count"] = len(feedback.get("feedback", []))
+        result["phase2_complete"] = feedback.get("interactive_complete", False)
 
     return result
 
 
-def load_sample_emails(persona_name: str, limit: int = 3) -> List[Dict]:
+def _read_persona_field(sample_file: Path) -> Optional[str]:
+    """
+    Return the persona a sample file belongs to.
+
+    Returns None if the file is unreadable or has no body/snippet to use as
+    an example, so the index only holds samples worth loading.
+    """
+    try:
+        with open(sample_file, 'rb') as f:
+            sample = _loads(f.read())
+        content = sample.get('content', {})
+        if not (content.get('body') or content.get('snippet')):
+            return None
+        return sample.get('persona')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=4)
+def _index_samples(samples_dir: str, mtime_ns: int) -> Dict[str, List[Path]]:
+    """
+    Map persona names to their sample files in one scandir pass.
+
+    Cached per directory mtime, which changes whenever ingest adds or removes
+    a sample. Sample files are small and numerous, so they are read on a
+    thread pool to overlap the disk I/O.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with os.scandir(samples_dir) as entries:
+        sample_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)
+        ]
+
+    index: Dict[str, List[Path]] = {}
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for sample_file, persona in zip(sample_files, executor.map(_read_persona_field, sample_files)):
+            if persona:
+                index.setdefault(persona, []).append(sample_file)
+
+    return index
+
+
+def build_sample_index() -> Dict[str, List[Path]]:
+    """
+    Map persona names to their sample files.
+
+    The index is shared between callers and must not be mutated.
+    """
+    try:
+        mtime_ns = SAMPLES_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _index_samples(str(SAMPLES_DIR), mtime_ns)
+
+
+def load_sample_emails(persona_name: str, limit: int = 3,
+                       sample_index: Optional[Dict[str, List[Path]]] = None) -> List[Dict]:
     """Load sample emails for a persona for few-shot examples."""
     samples = []
-    if not SAMPLES_DIR.exists():
-        return samples
+    if sample_index is None:
+        sample_index = build_sample_index()
 
-    for sample_file in SAMPLES_DIR.glob("*.json"):
+    # The index only holds samples with a body, so the first `limit` paths
+    # are all we need to open
+    for sample_file in sample_index.get(persona_name, [])[:limit]:
         try:
-            with open(sample_file) as f:
-                sample = json.load(f)
-            if sample.get('persona') == persona_name:
-                content = sample.get('content', {})
-                if content.get('body') or content.get('snippet'):
-                    samples.append({
-                        'subject': content.get('subject', ''),
-                        'body': content.get('body', content.get('snippet', '')),
-                        'to': content.get('to', ''),
-                        'analysis': sample.get('analysis', {})
-                    })
-                if len(samples) >= limit:
-                    break
+            with open(sample_file, 'rb') as f:
+                sample = _loads(f.read())
+            content = sample.get('content', {})
+            samples.append({
+                'subject': content.get('subject', ''),
+                'body': content.get('body', content.get('snippet', '')),
+                'to': content.get('to', ''),
+                'analysis': sample.get('analysis', {})
+            })
         except:
             continue
 
     return samples
 
 
-def generate_skill_md(user_name: str, personas: List[Dict], linkedin: Optional[Dict]) -> str:
+def load_persona_samples(limit: int = 2) -> Dict[str, List[Dict]]:
+    """
+    Load up to `limit` sample emails for every persona in one pass.
+
+    Returns:
+        Dict mapping persona name to its sample emails (see load_sample_emails)
+    """
+    sample_index = build_sample_index()
+    return {
+        name: load_sample_emails(name, limit=limit, sample_index=sample_index)
+        for name in sample_index
+    }
+
+
+def generate_skill_md(user_name: str, personas: List[Dict], linkedin: Optional[Dict],
+                      views: Optional[List[PersonaView]] = None) -> str:
     """Generate the main SKILL.md content."""
+    if views is None:
+        views = [_summarize_characteristics(p.get('characteristics', {})) for p in personas]
 
     # YAML frontmatter
     skill_name = f"{user_name.lower()}-writing-clone"
     description = f"Clone {user_name}'s writing voice for emails and LinkedIn posts. Use this skill when drafting emails, messages, or social posts that should match {user_name}'s authentic communication style."
 
-    content = f"""---
+    parts: List[str] = [f"""---
 name: {skill_name}
 description: >
   {description}
@@ -168,52 +361,43 @@ Before writing ANY text, determine the communication channel:
 
 ## Quick Reference: Email Personas
 
-"""
+"""]
 
     if personas:
-        content += "| Persona | Trigger | Tone Profile |\n"
-        content += "|---------|---------|-------------|\n"
-
-        for p in personas:
-            chars = p.get('characteristics', {})
-            tone_parts = []
-            for key in ['formality', 'warmth', 'authority', 'directness']:
-                val = chars.get(key)
-                if val is not None:
-                    tone_parts.append(f"{key[:4].title()}: {val}")
-            tone_str = ", ".join(tone_parts) if tone_parts else "See details"
+        parts.append(_PERSONA_TABLE_HEADER)
 
+        for p, view in zip(personas, views):
             desc = p.get('description', 'No description')[:50]
-            content += f"| **{p['name']}** | {desc} | {tone_str} |\n"
+            parts.append(f"| **{p['name']}** | {desc} | {view.tone_str} |\n")
 
-        content += "\n**For detailed persona profiles with examples, see:** [references/email_personas.md](references/email_personas.md)\n"
+        parts.append("\n**For detailed persona profiles with examples, see:** [references/email_personas.md](references/email_personas.md)\n")
     else:
-        content += "(No email personas analyzed yet)\n"
+        parts.append("(No email personas analyzed yet)\n")
 
-    content += "\n---\n\n## Quick Reference: LinkedIn Voice\n\n"
+    parts.append("\n---\n\n## Quick Reference: LinkedIn Voice\n\n")
 
     if linkedin:
         voice = linkedin.get('voice', linkedin.get('voice_configuration', {}))
         tone = voice.get('tone_vectors', {})
 
-        content += f"- **Confidence:** {linkedin.get('confidence', 'N/A')}\n"
-        content += f"- **Sample Size:** {linkedin.get('sample_size', 'N/A')} posts\n"
+        parts.append(f"- **Confidence:** {linkedin.get('confidence', 'N/A')}\n")
+        parts.append(f"- **Sample Size:** {linkedin.get('sample_size', 'N/A')} posts\n")
 
         if tone:
             tone_items = [f"{k}: {v}" for k, v in tone.items() if isinstance(v, (int, float))]
             if tone_items:
-                content += f"- **Tone:** {', '.join(tone_items[:4])}\n"
+                parts.append(f"- **Tone:** {', '.join(tone_items[:4])}\n")
 
         platform = linkedin.get('platform_rules', {})
         if platform:
-            content += f"- **Hashtags:** {platform.get('hashtag_strategy', 'N/A')}\n"
-            content += f"- **Length:** {platform.get('length_target', 'N/A')}\n"
+            parts.append(f"- **Hashtags:** {platform.get('hashtag_strategy', 'N/A')}\n")
+            parts.append(f"- **Length:** {platform.get('length_target', 'N/A')}\n")
 
-        content += "\n**For complete voice profile and examples, see:** [references/linkedin_voice.md](references/linkedin_voice.md)\n"
+        parts.append("\n**For complete voice profile and examples, see:** [references/linkedin_voice.md](references/linkedin_voice.md)\n")
     else:
-        content += "(No LinkedIn voice analyzed yet)\n"
+        parts.append("(No LinkedIn voice analyzed yet)\n")
 
-    content += """
+    parts.append("""
 ---
 
 ## Usage Instructions
@@ -238,19 +422,29 @@ When asked to write content:
    - Read the appropriate reference file for examples
    - Match tone vectors and structural patterns
    - Use characteristic phrases naturally
-"""
+""")
 
-    return content
+    return "".join(parts)
 
 
-def generate_email_personas_md(personas: List[Dict]) -> str:
+def write_email_personas_md(personas: List[Dict], fh: TextIO,
+                            views: Optional[List[PersonaView]] = None,
+                            persona_samples: Optional[Dict[str, List[Dict]]] = None) -> None:
     """
-    Generate detailed email personas reference file with full v2 JSON profiles embedded.
+    Write detailed email personas reference file with full v2 JSON profiles embedded.
 
     V2 Enhanced: Embeds complete JSON profile as code block for LLM consumption,
     plus human-readable quick reference.
+
+    Content is written to fh as it is produced, so the whole file (which
+    embeds every V2 profile) is never held in memory at once.
     """
-    content = """# Email Personas - V2 Detailed Profiles
+    if views is None:
+        views = [_summarize_characteristics(p.get('characteristics', {})) for p in personas]
+    if persona_samples is None:
+        persona_samples = load_persona_samples(limit=2)
+
+    fh.write("""# Email Personas - V2 Detailed Profiles
 
 This file contains complete persona definitions with voice fingerprints, relationship calibration, guardrails, and example emails.
 
@@ -258,117 +452,129 @@ This file contains complete persona definitions with voice fingerprints, relatio
 
 ---
 
-"""
+""")
 
-    for i, persona in enumerate(personas, 1):
+    for i, (persona, view) in enumerate(zip(personas, views), 1):
         name = persona.get('name', f'Persona {i}')
         desc = persona.get('description', 'No description')
         sample_count = persona.get('sample_count', 0)
 
-        content += f"## {i}. {name}\n\n"
-        content += f"**When to use:** {desc}\n\n"
-        content += f"**Sample count:** {sample_count} emails analyzed\n\n"
+        fh.writelines((
+            f"## {i}. {name}\n\n",
+            f"**When to use:** {desc}\n\n",
+            f"**Sample count:** {sample_count} emails analyzed\n\n"
+        ))
 
         # Check if v2 schema (has voice_fingerprint)
         if 'voice_fingerprint' in persona:
             # V2 Format: Embed full JSON profile
-            content += "### Full Profile (v2.0)\n\n"
-            content += "```json\n"
-
-            # Create clean profile for display (remove very long example bodies)
-            display_profile = json.loads(json.dumps(persona))  # Deep copy
-
-            # Truncate example bodies to save space
-            if 'example_bank' in display_profile and 'examples' in display_profile['example_bank']:
-                for ex in display_profile['example_bank']['examples']:
-                    if 'body' in ex and len(ex['body']) > 500:
-                        ex['body'] = ex['body'][:500] + '...[truncated]'
-
-            content += json.dumps(display_profile, indent=2)
-            content += "\n```\n\n"
+            fh.write("### Full Profile (v2.0)\n\n```json\n")
+
+            # Create clean profile for display (truncate very long example bodies).
+            # Only the example list is rebuilt; everything else is shared with persona.
+            display_profile = dict(persona)
+            example_bank = persona.get('example_bank')
+            if example_bank and 'examples' in example_bank:
+                display_profile['example_bank'] = {
+                    **example_bank,
+                    'examples': [
+                        {**ex, 'body': _trunc(ex['body'], 500, '...[truncated]')}
+                        if len(ex.get('body', '')) > 500 else ex
+                        for ex in example_bank['examples']
+                    ]
+                }
+
+            _dump(display_profile, fh)
+            fh.write("\n```\n\n")
 
             # Quick reference section (human-readable summary)
-            content += "### Quick Reference\n\n"
+            fh.write("### Quick Reference\n\n")
 
-            vf = persona.get('voice_fingerprint', {})
+            # Bind the nested sections once; `or {}` only allocates when a section is missing
+            vf = persona.get('voice_fingerprint') or {}
+            formality = vf.get('formality', {})
+            tone_markers = vf.get('tone_markers') or {}
+            greeting = (persona.get('opening_dna') or {}).get('primary_style')
+            sign_off = (persona.get('closing_dna') or {}).get('primary_style')
+            never_do = (persona.get('guardrails') or {}).get('never_do')
 
             # Formality
-            formality = vf.get('formality', {})
             if isinstance(formality, dict):
                 level = formality.get('level', 'N/A')
                 instruction = formality.get('instruction', '')
-                content += f"- **Formality:** {level}/10 - {instruction[:100]}{'...' if len(instruction) > 100 else ''}\n"
+                fh.write(f"- **Formality:** {level}/10 - {_trunc(instruction, 100)}\n")
             else:
-                content += f"- **Formality:** {formality}/10\n"
+                fh.write(f"- **Formality:** {formality}/10\n")
 
             # Tone markers
-            tone_markers = vf.get('tone_markers', {})
             for key in ['warmth', 'authority', 'directness']:
                 marker = tone_markers.get(key, {})
                 if isinstance(marker, dict):
                     level = marker.get('level', 'N/A')
                     instruction = marker.get('instruction', '')
-                    content += f"- **{key.title()}:** {level}/10 - {instruction[:80]}{'...' if len(instruction) > 80 else ''}\n"
+                    fh.write(f"- **{key.title()}:** {level}/10 - {_trunc(instruction, 80)}\n")
                 elif marker:
-                    content += f"- **{key.title()}:** {marker}/10\n"
+                    fh.write(f"- **{key.title()}:** {marker}/10\n")
 
             # Opening/closing patterns
-            opening = persona.get('opening_dna', {})
-            if opening.get('primary_style'):
-                content += f"- **Primary Greeting:** {opening['primary_style']}\n"
-
-            closing = persona.get('closing_dna', {})
-            if closing.get('primary_style'):
-                content += f"- **Primary Sign-off:** {closing['primary_style']}\n"
+            if greeting:
+                fh.write(f"- **Primary Greeting:** {greeting}\n")
+            if sign_off:
+                fh.write(f"- **Primary Sign-off:** {sign_off}\n")
 
             # Guardrails summary
-            guardrails = persona.get('guardrails', {})
-            if guardrails.get('never_do'):
-                content += f"- **Never Do:** {', '.join(guardrails['never_do'][:3])}\n"
+            if never_do:
+                fh.write(f"- **Never Do:** {', '.join(never_do[:3])}\n")
 
-            content += "\n"
+            fh.write("\n")
 
         else:
             # V1 Fallback: Original format
-            chars = persona.get('characteristics', {})
-
-            content += "### Tone Vectors\n\n"
-            content += "| Dimension | Score (1-10) |\n"
-            content += "|-----------|-------------|\n"
-
-            for key in ['formality', 'warmth', 'authority', 'directness']:
-                val = chars.get(key, 'N/A')
-                content += f"| {key.title()} | {val} |\n"
-
-            content += "\n### Structural Patterns\n\n"
-            content += f"- **Typical Greeting:** {chars.get('typical_greeting', 'N/A')}\n"
-            content += f"- **Typical Closing:** {chars.get('typical_closing', 'N/A')}\n"
-            content += f"- **Uses Contractions:** {chars.get('uses_contractions', 'N/A')}\n"
+            fh.write("### Tone Vectors\n\n| Dimension | Score (1-10) |\n|-----------|-------------|\n")
+            fh.writelines(f"| {label} | {val} |\n" for label, val in view.rows)
+            fh.writelines((
+                "\n### Structural Patterns\n\n",
+                f"- **Typical Greeting:** {view.greeting}\n",
+                f"- **Typical Closing:** {view.closing}\n",
+                f"- **Uses Contractions:** {view.contractions}\n"
+            ))
 
-            if chars.get('tone'):
-                content += f"- **Tone Descriptors:** {', '.join(chars.get('tone', []))}\n"
+            if view.descriptors:
+                fh.write(f"- **Tone Descriptors:** {view.descriptors}\n")
 
-            content += "\n"
+            fh.write("\n")
 
         # Load sample emails for this persona
-        samples = load_sample_emails(name, limit=2)
+        samples = persona_samples.get(name, [])[:2]
         if samples:
-            content += "### Example Emails\n\n"
+            fh.write("### Example Emails\n\n")
             for j, sample in enumerate(samples, 1):
-                content += f"**Example {j}:**\n"
+                fh.write(f"**Example {j}:**\n")
                 if sample.get('subject'):
-                    content += f"- Subject: {sample['subject']}\n"
+                    fh.write(f"- Subject: {sample['subject']}\n")
                 body = sample.get('body', '')
-                content += f"```\n{body[:500]}{'...' if len(body) > 500 else ''}\n```\n\n"
+                fh.write(f"```\n{_trunc(body, 500)}\n```\n\n")
 
-        content += "---\n\n"
+        fh.write("---\n\n")
 
-    return content
 
+def generate_email_personas_md(personas: List[Dict],
+                               views: Optional[List[PersonaView]] = None,
+                               persona_samples: Optional[Dict[str, List[Dict]]] = None) -> str:
+    """Generate the email personas reference file as a string."""
+    buffer = io.StringIO()
+    write_email_personas_md(personas, buffer, views, persona_samples)
+    return buffer.getvalue()
 
-def generate_linkedin_voice_md(linkedin: Dict) -> str:
-    """Generate detailed LinkedIn voice reference file."""
-    content = """# LinkedIn Voice - Complete Profile
+
+def generate_linkedin_voice_md(linkedin: Dict, raw_bytes: Optional[bytes] = None) -> str:
+    """
+    Generate detailed LinkedIn voice reference file.
+
+    If raw_bytes (the linkedin_persona.json contents) is given and there are
+    no few-shot examples to strip, the file is embedded without re-encoding.
+    """
+    parts: List[str] = ["""# LinkedIn Voice - Complete Profile
 
 This file contains the complete LinkedIn voice profile including tone vectors, platform rules, and example posts.
 
@@ -376,56 +582,60 @@ This file contains the complete LinkedIn voice profile including tone vectors, p
 
 ## Voice Profile
 
-"""
+"""]
 
     # Add JSON profile
-    content += "### Full Configuration (JSON)\n\n"
-    content += "```json\n"
+    parts.append("### Full Configuration (JSON)\n\n")
+    parts.append("```json\n")
 
-    # Create a clean copy for display
-    display_profile = {k: v for k, v in linkedin.items() if k not in ['few_shot_examples']}
-    content += json.dumps(display_profile, indent=2)
-    content += "\n```\n\n"
+    if raw_bytes is not None and 'few_shot_examples' not in linkedin:
+        # Nothing to strip - linkedin_persona.json is already indented JSON
+        parts.append(raw_bytes.decode('utf-8').rstrip())
+    else:
+        # Create a clean copy for display
+        display_profile = {k: v for k, v in linkedin.items() if k not in ['few_shot_examples']}
+        parts.append(_dumps(display_profile))
+    parts.append("\n```\n\n")
 
     # Voice characteristics
     voice = linkedin.get('voice', linkedin.get('voice_configuration', {}))
 
     if voice.get('tone_vectors'):
-        content += "### Tone Vectors\n\n"
-        content += "| Dimension | Score |\n"
-        content += "|-----------|-------|\n"
+        parts.append("### Tone Vectors\n\n")
+        parts.append("| Dimension | Score |\n")
+        parts.append("|-----------|-------|\n")
         for k, v in voice['tone_vectors'].items():
             if isinstance(v, (int, float)):
-                content += f"| {k.replace('_', ' ').title()} | {v} |\n"
-        content += "\n"
+                parts.append(f"| {k.replace('_', ' ').title()} | {v} |\n")
+        parts.append("\n")
 
     if voice.get('signature_phrases'):
-        content += "### Signature Phrases\n\n"
+        parts.append("### Signature Phrases\n\n")
         for phrase in voice['signature_phrases']:
-            content += f"- \"{phrase}\"\n"
-        content += "\n"
+            parts.append(f"- \"{phrase}\"\n")
+        parts.append("\n")
 
     # Platform rules
     platform = linkedin.get('platform_rules', {})
     if platform:
-        content += "### Platform Rules\n\n"
+        parts.append("### Platform Rules\n\n")
         for key, value in platform.items():
-            content += f"- **{key.replace('_', ' ').title()}:** {value}\n"
-        content += "\n"
+            parts.append(f"- **{key.replace('_', ' ').title()}:** {value}\n")
+        parts.append("\n")
 
     # Guardrails
     guardrails = linkedin.get('guardrails', {})
     if guardrails:
-        content += "### Guardrails (What NOT to do)\n\n"
+        parts.append("### Guardrails (What NOT to do)\n\n")
         if guardrails.get('never_do'):
-            content += "**Never:**\n"
+            parts.append("**Never:**\n")
             for item in guardrails['never_do']:
-                content += f"- {item}\n"
+                parts.append(f"- {item}\n")
         if guardrails.get('forbidden_phrases'):
-            content += "\n**Forbidden phrases:**\n"
+            parts.append("\n**Forbidden phrases:**\n")
             for phrase in guardrails['forbidden_phrases']:
-                content += f"- \"{phrase}\"\n"
-        content += "\n"
+                parts.append(f"- \"{phrase}\"\n")
+        parts.append("\n")
 
     # Few-shot examples
     examples = linkedin.get('few_shot_examples', [])
@@ -434,18 +644,30 @@ This file contains the complete LinkedIn voice profile including tone vectors, p
         examples = linkedin.get('voice', {}).get('few_shot_examples', [])
 
     if examples:
-        content += "---\n\n## Example Posts\n\n"
+        parts.append("---\n\n## Example Posts\n\n")
         for i, ex in enumerate(examples, 1):
             context = ex.get('input_context', 'General Post')
             text = ex.get('output_text', '')
-            content += f"### Example {i}: {context}\n\n"
-            content += f"```\n{text}\n```\n\n"
+            parts.append(f"### Example {i}: {context}\n\n")
+            parts.append(f"```\n{text}\n```\n\n")
+
+    return "".join(parts)
 
-    return content
 
+def _write_email_personas_file(email_file: Path, personas: List[Dict],
+                               views: List[PersonaView]) -> None:
+    """Stream the email personas reference straight to disk."""
+    with open(email_file, 'w', encoding='utf-8', buffering=1 << 20) as fh:
+        write_email_personas_md(personas, fh, views)
 
-def generate_skill(user_name: str, output_dir: Path) -> Path:
-    """Generate the complete skill package."""
+
+def generate_skill(user_name: str, output_dir: Path) -> Tuple[Path, List[Path]]:
+    """
+    Generate the complete skill package.
+
+    Returns:
+        Tuple of (skill_dir, written_files) - written_files lists every file created
+    """
 
     skill_name = f"{user_name.lower()}-writing-clone"
     skill_dir = output_dir / skill_name
@@ -454,88 +676,112 @@ def generate_skill(user_name: str, output_dir: Path) -> Path:
     # Create directories
     skill_dir.mkdir(parents=True, exist_ok=True)
     references_dir.mkdir(parents=True, exist_ok=True)
+    written_files = []
 
     # Load data
     personas = load_email_personas()
-    linkedin = load_linkedin_persona()
+    linkedin, linkedin_raw = load_linkedin_persona_raw()
 
     print(f"[STATS] Loading persona data...")
     print(f"   Email personas: {len(personas)}")
     print(f"   LinkedIn voice: {'Yes' if linkedin else 'No'}")
 
+    # Summarize characteristics once for both markdown generators
+    views = [_summarize_characteristics(p.get('characteristics', {})) for p in personas]
+
+    email_file = references_dir / "email_personas.md"
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Render the three files concurrently - email personas reads sample files,
+    # so its disk I/O overlaps with the other two
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        skill_future = executor.submit(generate_skill_md, user_name, personas, linkedin, views)
+        email_future = executor.submit(_write_email_personas_file, email_file, personas, views) if personas else None
+        linkedin_future = executor.submit(generate_linkedin_voice_md, linkedin, linkedin_raw) if linkedin else None
+
     # Generate SKILL.md
-    skill_content = generate_skill_md(user_name, personas, linkedin)
     skill_file = skill_dir / "SKILL.md"
-    with open(skill_file, 'w') as f:
-        f.write(skill_content)
+    skill_file.write_text(skill_future.result(), encoding='utf-8')
+    written_files.append(skill_file)
     print(f"   [OK] Created SKILL.md")
 
     # Generate email personas reference
-    if personas:
-        email_content = generate_email_personas_md(personas)
-        email_file = references_dir / "email_personas.md"
-        with open(email_file, 'w') as f:
-            f.write(email_content)
+    if email_future:
+        email_future.result()
+        written_files.append(email_file)
         print(f"   [OK] Created references/email_personas.md")
 
     # Generate LinkedIn voice reference
-    if linkedin:
-        linkedin_content = generate_linkedin_voice_md(linkedin)
+    if linkedin_future:
         linkedin_file = references_dir / "linkedin_voice.md"
-        with open(linkedin_file, 'w') as f:
-            f.write(linkedin_content)
+        linkedin_file.write_text(linkedin_future.result(), encoding='utf-8')
+        written_files.append(linkedin_file)
         print(f"   [OK] Created references/linkedin_voice.md")
 
-    return skill_dir
+    return skill_dir, written_files
 
 
 def show_status():
     """Show what data is available for skill generation."""
-    print(f"\n{'=' * 50}")
-    print("SKILL GENERATION STATUS")
-    print(f"{'=' * 50}")
+    out = []
+    out.append(f"\n{'=' * 50}")
+    out.append("SKILL GENERATION STATUS")
+    out.append(f"{'=' * 50}")
 
     # Check email personas
     if PERSONA_REGISTRY_FILE.exists():
-        with open(PERSONA_REGISTRY_FILE) as f:
-            data = json.load(f)
+        data, _ = _read_json(PERSONA_REGISTRY_FILE)
         personas = data.get('personas', {})
-        print(f"\n[EMAIL] Email Personas: {len(personas)}")
+        out.append(f"\n[EMAIL] Email Personas: {len(personas)}")
         for name, info in personas.items():
-            print(f"   - {name}: {info.get('sample_count', 0)} samples")
+            out.append(f"   - {name}: {info.get('sample_count', 0)} samples")
     else:
-        print(f"\n[EMAIL] Email Personas: None found")
+        out.append(f"\n[EMAIL] Email Personas: None found")
 
     # Check LinkedIn persona
     if LINKEDIN_PERSONA_FILE.exists():
-        with open(LINKEDIN_PERSONA_FILE) as f:
-            data = json.load(f)
-        print(f"\n[LINK] LinkedIn Voice: Found")
-        print(f"   Confidence: {data.get('confidence', 'N/A')}")
-        print(f"   Sample size: {data.get('sample_size', 'N/A')}")
+        data, _ = _read_json(LINKEDIN_PERSONA_FILE)
+        out.append(f"\n[LINK] LinkedIn Voice: Found")
+        out.append(f"   Confidence: {data.get('confidence', 'N/A')}")
+        out.append(f"   Sample size: {data.get('sample_size', 'N/A')}")
     else:
-        print(f"\n[LINK] LinkedIn Voice: None found")
+        out.append(f"\n[LINK] LinkedIn Voice: None found")
 
-    print(f"\n{'=' * 50}")
-    print("\nTo generate the skill:")
-    print("  python generate_skill.py --name <your-name>")
-    print(f"{'=' * 50}\n")
+    out.append(f"\n{'=' * 50}")
+    out.append("\nTo generate the skill:")
+    out.append("  python generate_skill.py --name <your-name>")
+    out.append(f"{'=' * 50}\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Generate a writing clone skill package",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_DESCRIPTION = "Generate a writing clone skill package"
+_EPILOG = """
 Examples:
   python generate_skill.py                    # Prompts for name
   python generate_skill.py --name john        # Uses provided name
   python generate_skill.py --status           # Show available data
   python generate_skill.py --output ~/skills  # Custom output directory
         """
+
+
+def main():
+    # Fast path: plain --status needs no argument parsing
+    if sys.argv[1:] == ["--status"]:
+        show_status()
+        return
+
+    # Imported here rather than at module level so importing this module
+    # (e.g. for --status or from tests) doesn't pay for argparse
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     parser.add_argument("--name", type=str, help="Your name for the skill (e.g., 'john')")
-    parser.add_argument("--output", type=str, default=str(Path.home() / "Documents"),
+    parser.add_argument("--output", type=str, default=None,
                         help="Output directory (default: ~/Documents)")
     parser.add_argument("--status", action="store_true", help="Show available data")
     parser.add_argument("--skip-validation-check", action="store_true",
@@ -555,11 +801,11 @@ Examples:
         sys.exit(1)
 
     # Validate name
-    if not user_name.replace('-', '').replace('_', '').isalnum():
+    if not _NAME_RE.match(user_name):
         print("[ERROR] Name should only contain letters, numbers, hyphens, or underscores")
         return
 
-    output_dir = Path(args.output)
+    output_dir = Path(args.output) if args.output else Path(os.path.expanduser("~/Documents"))
 
     # Check validation status (unless skipped)
     if not args.skip_validation_check:
@@ -618,28 +864,29 @@ TO PROCEED ANYWAY (not recommended):
     print("GENERATING WRITING CLONE SKILL")
     print(f"{'=' * 60}\n")
 
-    skill_dir = generate_skill(user_name, output_dir)
+    skill_dir, written_files = generate_skill(user_name, output_dir)
 
     # Success message with installation instructions
-    print(f"\n{'=' * 60}")
-    print("[OK] WRITING CLONE SKILL GENERATED")
-    print(f"{'=' * 60}")
-    print(f"\nSkill created at: {skill_dir}")
-    print(f"\nFiles generated:")
-    for f in skill_dir.rglob("*"):
-        if f.is_file():
-            print(f"   - {f.relative_to(skill_dir)}")
-
-    print(f"\n{'-' * 60}")
-    print("[PACKAGE] TO INSTALL THIS SKILL:")
-    print(f"{'-' * 60}")
-    print("\nOption 1: Ask the LLM to install it")
-    print(f"   START A NEW CHAT and say:")
-    print(f"   'Install my writing clone skill from {skill_dir}'")
-    print()
-    print("Option 2: Manual installation")
-    print(f"   cp -r {skill_dir} ~/.claude/skills/")
-    print(f"{'=' * 60}\n")
+    out = []
+    out.append(f"\n{'=' * 60}")
+    out.append("[OK] WRITING CLONE SKILL GENERATED")
+    out.append(f"{'=' * 60}")
+    out.append(f"\nSkill created at: {skill_dir}")
+    out.append(f"\nFiles generated:")
+    for f in written_files:
+        out.append(f"   - {f.relative_to(skill_dir)}")
+
+    out.append(f"\n{'-' * 60}")
+    out.append("[PACKAGE] TO INSTALL THIS SKILL:")
+    out.append(f"{'-' * 60}")
+    out.append("\nOption 1: Ask the LLM to install it")
+    out.append(f"   START A NEW CHAT and say:")
+    out.append(f"   'Install my writing clone skill from {skill_dir}'")
+    out.append("")
+    out.append("Option 2: Manual installation")
+    out.append(f"   cp -r {skill_dir} ~/.claude/skills/")
+    out.append(f"{'=' * 60}\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == '__main__':
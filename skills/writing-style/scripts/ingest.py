@@ -22,16 +22,26 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import os
 import json
+import bisect
 import sys
-import argparse
 from pathlib import Path
 from datetime import datetime
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 from config import get_data_dir, get_path
-from email_analysis_v2 import detect_schema_version, migrate_v1_to_v2
 from typing import Dict
 
+# orjson is optional - faster JSON serialization when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Export functions for external use (e.g., by analyze_clusters.py)
 __all__ = ['ingest_batch', 'load_json', 'save_json', 'PERSONA_FILE', 'validate_ingest_result']
 
@@ -41,24 +51,164 @@ RAW_SAMPLES_DIR = get_path("raw_samples")
 PERSONA_FILE = get_path("persona_registry.json")
 STATE_FILE = get_path("state.json")
 CLUSTERS_FILE = get_path("clusters.json")
+VALIDATION_DIR = get_path("validation_set")
 
 # Minimum coverage threshold for persona quality
 MIN_COVERAGE_THRESHOLD = 0.8
 
+# Confidence indicators: below 0.4, 0.4 to <0.7, and 0.7 or above
+_CONF_THRESHOLDS = (0.4, 0.7)
+_CONF_INDICATORS = ("[WARNING]", "?", "[OK]")
+
+# Raw email fields copied into each sample for the generation phase
+CONTENT_FIELDS = ("subject", "body", "snippet", "from", "to", "date")
 
-def load_json(path):
-    """Load JSON file, return empty dict if not found."""
-    if path.exists():
+
+def load_json(path, default=None):
+    """Load JSON file, return `default` (or an empty dict) if not found."""
+    try:
         with open(path) as f:
             return json.load(f)
-    return {}
+    except FileNotFoundError:
+        return {} if default is None else default
+
+
+def _loads(data):
+    """Parse JSON from bytes or str, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _all_ascii(data):
+    """True if every string in JSON-shaped data, keys included, is ASCII.
+
+    str.isascii() is O(1) in CPython, so this only costs a walk over the
+    containers - far less than serializing.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is str:
+            if not item.isascii():
+                return False
+        elif kind is dict:
+            for key in item:
+                if type(key) is str and not key.isascii():
+                    return False
+            stack.extend(item.values())
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+    return True
+
+
+def _dumps(data):
+    """Serialize to 2-space indented, ASCII-only JSON.
+
+    orjson output is used when the data is pure ASCII (it then matches
+    json.dumps(indent=2)); otherwise fall back to the stdlib so files keep
+    escaping non-ASCII text and stay readable with any default encoding.
+    The check runs on the input, so no save serializes twice.
+    """
+    if ORJSON_AVAILABLE and _all_ascii(data):
+        try:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            return raw.decode()
+        except orjson.JSONEncodeError:
+            pass
+    # Data here always comes from parsed JSON, so it cannot be cyclic
+    return json.dumps(data, indent=2, check_circular=False)
 
 
 def save_json(path, data):
-    """Save data to JSON file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    """Save data to JSON file atomically.
+
+    Writes to a temp file next to `path`, fsyncs it, then renames it over
+    the original so a crash mid-write never leaves a truncated file. The
+    write is skipped entirely if the file already holds the same content.
+    """
+    content = _dumps(data).encode()
+    try:
+        # Size check first so a changed file usually costs only a stat
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "wb", buffering=65536) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=1)
+def _load_clusters_cached(path_str, mtime_ns, size):
+    """Parse clusters.json and index clusters by id (cached per file version)."""
+    with open(path_str, "rb") as f:
+        clusters_data = _loads(f.read())
+    clusters = clusters_data.get('clusters', []) if clusters_data else []
+    # Reversed so the first cluster with a given id wins, as in a linear scan
+    clusters_by_id = {c.get('id'): c for c in reversed(clusters)}
+    return clusters_data, clusters_by_id
+
+
+def _load_clusters():
+    """Load clusters.json as (clusters_data, clusters_by_id).
+
+    Results are cached on the file's mtime and size, so repeated calls within
+    an ingest only parse the file once. Returns ({}, {}) if it doesn't exist.
+    """
+    try:
+        st = os.stat(CLUSTERS_FILE)
+    except FileNotFoundError:
+        return {}, {}
+    return _load_clusters_cached(str(CLUSTERS_FILE), st.st_mtime_ns, st.st_size)
+
+
+def _list_names(directory):
+    """Return the set of entry names in a directory (empty if missing)."""
+    try:
+        with os.scandir(directory) as it:
+            return {e.name for e in it}
+    except FileNotFoundError:
+        return set()
+
+
+def _list_sample_ids():
+    """Return the set of sample ids already saved in SAMPLES_DIR."""
+    return {name[:-5] for name in _list_names(SAMPLES_DIR) if name.endswith(".json")}
+
+
+def _write_one(path, data):
+    """Write a single sample file."""
+    with open(path, "w", buffering=65536) as f:
+        f.write(_dumps(data))
+
+
+def write_samples_batch(items):
+    """Write a batch of sample files in parallel.
+
+    Each sample file is independent, so writes are spread over a thread
+    pool to overlap per-file open/write/close latency.
+
+    Args:
+        items: List of (path, sample_data) pairs
+    """
+    if not items:
+        return
+    SAMPLES_DIR.mkdir(parents=True, exist_ok=True)
+    if len(items) == 1:
+        _write_one(*items[0])
+        return
+    with ThreadPoolExecutor(max_workers=min(32, len(items))) as executor:
+        # list() re-raises the first write error, if any
+        list(executor.map(_write_one, *zip(*items)))
 
 
 def validate_ingest_result(batch: Dict, dry_run: bool = False) -> bool:
@@ -107,7 +257,13 @@ def validate_ingest_result(batch: Dict, dry_run: bool = False) -> bool:
     return True
 
 
-def validate_batch_coverage(batch_data: dict, force: bool = False) -> tuple:
+def _canon(sid):
+    """Normalize a sample id by stripping the optional "email_" prefix."""
+    return sid[6:] if sid.startswith("email_") else sid
+
+
+def validate_batch_coverage(batch_data: dict, force: bool = False,
+                            analyzed_ids: set = None) -> tuple:
     """Validate that batch ingestion meets coverage requirements.
 
     Checks if the batch covers a cluster and whether ingesting it would
@@ -116,16 +272,14 @@ def validate_batch_coverage(batch_data: dict, force: bool = False) -> tuple:
     Args:
         batch_data: The batch JSON data with samples
         force: If True, return warnings but don't block
+        analyzed_ids: Sample ids already saved (scanned from SAMPLES_DIR if None)
 
     Returns:
         tuple: (should_proceed: bool, message: str)
     """
-    if not CLUSTERS_FILE.exists():
-        # No clusters - legacy mode, allow ingestion
-        return True, ""
-
-    clusters_data = load_json(CLUSTERS_FILE)
+    clusters_data, clusters_by_id = _load_clusters()
     if not clusters_data:
+        # No clusters - legacy mode, allow ingestion
         return True, ""
 
     cluster_id = batch_data.get("cluster_id")
@@ -133,21 +287,14 @@ def validate_batch_coverage(batch_data: dict, force: bool = False) -> tuple:
         # No cluster_id in batch - legacy mode, allow
         return True, ""
 
-    # Find the cluster
-    cluster = None
-    for c in clusters_data.get('clusters', []):
-        if c.get('id') == cluster_id:
-            cluster = c
-            break
+    cluster = clusters_by_id.get(cluster_id)
 
     if not cluster:
         return True, f"Warning: Cluster {cluster_id} not found in clusters.json"
 
     # Count already analyzed samples
-    analyzed_ids = set()
-    if SAMPLES_DIR.exists():
-        for f in SAMPLES_DIR.glob("*.json"):
-            analyzed_ids.add(f.stem)
+    if analyzed_ids is None:
+        analyzed_ids = _list_sample_ids()
 
     sample_ids = cluster.get('sample_ids', [])
     total_in_cluster = len(sample_ids)
@@ -157,25 +304,18 @@ def validate_batch_coverage(batch_data: dict, force: bool = False) -> tuple:
 
     # Count samples in this batch that belong to this cluster
     batch_samples = batch_data.get("samples", [])
-    batch_sample_ids = set()
-    for s in batch_samples:
-        sid = s.get("id", "")
-        # Handle both "email_xxx" and "xxx" formats
-        if sid.startswith("email_"):
-            batch_sample_ids.add(sid)
-            batch_sample_ids.add(sid[6:])  # Also add without prefix
-        else:
-            batch_sample_ids.add(sid)
-            batch_sample_ids.add(f"email_{sid}")  # Also add with prefix
-
-    # Current coverage before this batch
-    already_analyzed = sum(1 for s in sample_ids if s in analyzed_ids)
+    # Handle both "email_xxx" and "xxx" formats via one canonical form
+    batch_sample_ids = {_canon(s.get("id", "")) for s in batch_samples}
+
+    # One pass: samples already analyzed, and new samples from this batch
+    already_analyzed = new_from_batch = 0
+    for s in sample_ids:
+        if s in analyzed_ids:
+            already_analyzed += 1
+        elif _canon(s) in batch_sample_ids:
+            new_from_batch += 1
     current_coverage = already_analyzed / total_in_cluster
 
-    # New samples from this batch (not already ingested)
-    new_from_batch = sum(1 for s in sample_ids
-                        if s in batch_sample_ids and s not in analyzed_ids)
-
     # Projected coverage after this batch
     projected_analyzed = already_analyzed + new_from_batch
     projected_coverage = projected_analyzed / total_in_cluster
@@ -221,24 +361,52 @@ OPTIONS:
     return True, ""
 
 
-def ingest_batch(batch_file, dry_run=False, force=False):
+def ingest_batch(batch_file, dry_run=False, force=False, quiet=False):
     """Process a batch analysis file.
 
+    The report is collected while the batch is processed and written to
+    stdout in one go at the end (or on error).
+
     Args:
         batch_file: Path to the batch JSON file
         dry_run: If True, preview without saving
         force: If True, bypass coverage validation
+        quiet: If True, suppress the ingest report
     """
 
     # Load batch data
-    with open(batch_file) as f:
-        batch = json.load(f)
+    with open(batch_file, "rb") as f:
+        batch = _loads(f.read())
+
+    out = []
+    try:
+        ok = _ingest_batch(batch, out, dry_run=dry_run, force=force)
+    finally:
+        if out and not quiet:
+            sys.stdout.write("\n".join(out) + "\n")
+            sys.stdout.flush()
 
+    # Post-ingest validation
+    if ok and not dry_run:
+        validate_ingest_result(batch, dry_run=dry_run)
+
+    return ok
+
+
+def _ingest_batch(batch, out, dry_run=False, force=False):
+    """Ingest a parsed batch, appending report lines to `out`.
+
+    Returns:
+        bool: False if the batch was rejected, True otherwise
+    """
     # Validate coverage requirements (unless dry-run)
+    analyzed_ids = None
     if not dry_run:
-        should_proceed, message = validate_batch_coverage(batch, force=force)
+        analyzed_ids = _list_sample_ids()
+        should_proceed, message = validate_batch_coverage(
+            batch, force=force, analyzed_ids=analyzed_ids)
         if message:
-            print(message)
+            out.append(message)
         if not should_proceed:
             return False
 
@@ -246,38 +414,47 @@ def ingest_batch(batch_file, dry_run=False, force=False):
     new_personas = batch.get("new_personas", [])
     
     if not samples:
-        print("[ERROR] No 'samples' array found in batch file")
-        print("\n[LIST] Expected format:")
-        print('  "samples": [')
-        print('    {"id": "email_xxx", "source": "email", "persona": "Name", "confidence": 0.85, "analysis": {...}, "context": {...}}')
-        print('  ]')
+        out.append("[ERROR] No 'samples' array found in batch file")
+        out.append("\n[LIST] Expected format:")
+        out.append('  "samples": [')
+        out.append('    {"id": "email_xxx", "source": "email", "persona": "Name", "confidence": 0.85, "analysis": {...}, "context": {...}}')
+        out.append('  ]')
         
         # Check for common mistakes
         if "sample_ids" in batch:
-            print("\n[WARNING]  Found 'sample_ids' - did you mean 'samples'?")
-            print("    Each sample needs full analysis object, not just IDs.")
+            out.append("\n[WARNING]  Found 'sample_ids' - did you mean 'samples'?")
+            out.append("    Each sample needs full analysis object, not just IDs.")
         if "persona" in batch and "new_personas" not in batch:
-            print("\n[WARNING]  Found 'persona' (singular) - did you mean 'new_personas' (array)?")
+            out.append("\n[WARNING]  Found 'persona' (singular) - did you mean 'new_personas' (array)?")
         if batch.get("samples") == []:
-            print("\n[WARNING]  'samples' array exists but is empty.")
+            out.append("\n[WARNING]  'samples' array exists but is empty.")
         
-        print("\n[READ] Run: python prepare_batch.py")
-        print("    The output includes the required JSON schema.")
+        out.append("\n[READ] Run: python prepare_batch.py")
+        out.append("    The output includes the required JSON schema.")
         return False
     
-    print(f"[PACKAGE] Processing batch: {len(samples)} samples, {len(new_personas)} new personas")
+    out.append(f"[PACKAGE] Processing batch: {len(samples)} samples, {len(new_personas)} new personas")
     
     if dry_run:
-        print("\n[SEARCH] DRY RUN - no changes will be made\n")
+        out.append("\n[SEARCH] DRY RUN - no changes will be made\n")
     
+    # One timestamp for the whole batch
+    now_iso = datetime.now().isoformat()
+
     # Load existing data
-    personas = load_json(PERSONA_FILE) if PERSONA_FILE.exists() else {"personas": {}, "created": datetime.now().isoformat()}
+    personas = load_json(PERSONA_FILE, default={"personas": {}, "created": now_iso})
     state = load_json(STATE_FILE)
     
+    # Imported here so --status and library imports (analyze_clusters.py)
+    # don't pay for loading the analysis module
+    from email_analysis_v2 import detect_schema_version, migrate_v1_to_v2
+
     # Detect batch schema version
     batch_version = detect_schema_version(batch)
-    if batch_version == "1.0":
-        print(f"  [PACKAGE] Detected v1.0 schema - will migrate to v2.0")
+    # Batches declared/detected as v2 skip the per-item migration checks
+    needs_migration = batch_version == "1.0"
+    if needs_migration:
+        out.append(f"  [PACKAGE] Detected v1.0 schema - will migrate to v2.0")
 
     # Process personas (new or existing)
     for persona in new_personas:
@@ -287,9 +464,9 @@ def ingest_batch(batch_file, dry_run=False, force=False):
 
         is_existing = name in personas.get("personas", {})
         if is_existing:
-            print(f"  Updating persona: {name}")
+            out.append(f"  Updating persona: {name}")
         else:
-            print(f"  New persona: {name}")
+            out.append(f"  New persona: {name}")
 
         if not dry_run:
             if "personas" not in personas:
@@ -297,9 +474,9 @@ def ingest_batch(batch_file, dry_run=False, force=False):
 
             # Check if persona needs migration (v1 -> v2)
             characteristics = persona.get("characteristics", {})
-            if characteristics and "voice_fingerprint" not in characteristics:
+            if needs_migration and characteristics and "voice_fingerprint" not in characteristics:
                 # V1 format - migrate to v2
-                print(f"    Migrating {name} from v1 to v2 schema")
+                out.append(f"    Migrating {name} from v1 to v2 schema")
                 characteristics = migrate_v1_to_v2(characteristics)
 
             # Always write persona data (update existing or create new)
@@ -309,21 +486,23 @@ def ingest_batch(batch_file, dry_run=False, force=False):
                 personas["personas"][name] = {
                     "description": persona.get("description", existing.get("description", "")),
                     "sample_count": existing.get("sample_count", 0),
-                    "created": existing.get("created", datetime.now().isoformat()),
-                    "updated": datetime.now().isoformat(),
+                    "created": existing.get("created", now_iso),
+                    "updated": now_iso,
                     "characteristics": characteristics or existing.get("characteristics", {})
                 }
             else:
                 personas["personas"][name] = {
                     "description": persona.get("description", ""),
                     "sample_count": 0,
-                    "created": datetime.now().isoformat(),
+                    "created": now_iso,
                     "characteristics": characteristics
                 }
     
     # Process samples
     saved_count = 0
-    persona_counts = {}
+    persona_counts = Counter(s.get("persona", "Unassigned") for s in samples if s.get("id"))
+    pending_writes = []
+    raw_index = _list_names(RAW_SAMPLES_DIR)
     
     for sample in samples:
         sample_id = sample.get("id")
@@ -331,30 +510,22 @@ def ingest_batch(batch_file, dry_run=False, force=False):
             continue
         
         persona_name = sample.get("persona", "Unassigned")
-        persona_counts[persona_name] = persona_counts.get(persona_name, 0) + 1
         
         # Load email content from raw_samples
-        raw_email_file = RAW_SAMPLES_DIR / f"email_{sample_id}.json"
+        raw_name = f"email_{sample_id}.json"
         email_content = {}
-        if raw_email_file.exists():
-            with open(raw_email_file) as f:
-                raw_data = json.load(f)
-                # Extract essential fields for generation phase
-                email_content = {
-                    "subject": raw_data.get("subject", ""),
-                    "body": raw_data.get("body", ""),
-                    "snippet": raw_data.get("snippet", ""),
-                    "from": raw_data.get("from", ""),
-                    "to": raw_data.get("to", ""),
-                    "date": raw_data.get("date", "")
-                }
+        if raw_name in raw_index:
+            with open(RAW_SAMPLES_DIR / raw_name, "rb") as f:
+                raw_data = _loads(f.read())
+            # Extract essential fields for generation phase
+            email_content = {k: raw_data.get(k, "") for k in CONTENT_FIELDS}
         
         # Save sample file
         sample_file = SAMPLES_DIR / f"{sample_id}.json"
 
         # Migrate sample analysis if v1 format
         analysis = sample.get("analysis", {})
-        if analysis and "voice_fingerprint" not in analysis:
+        if needs_migration and analysis and "voice_fingerprint" not in analysis:
             # V1 format - migrate to v2
             analysis = migrate_v1_to_v2(analysis)
 
@@ -365,122 +536,111 @@ def ingest_batch(batch_file, dry_run=False, force=False):
             "confidence": sample.get("confidence", 0.0),
             "analysis": analysis,
             "content": email_content,
-            "ingested": datetime.now().isoformat()
+            "ingested": now_iso
         }
         
         if not dry_run:
-            SAMPLES_DIR.mkdir(parents=True, exist_ok=True)
-            save_json(sample_file, sample_data)
+            pending_writes.append((sample_file, sample_data))
         
         saved_count += 1
         conf = sample.get("confidence", 0)
-        conf_indicator = "[OK]" if conf >= 0.7 else "?" if conf >= 0.4 else "[WARNING]"
-        print(f"  {conf_indicator} {sample_id[:20]}... -> {persona_name} ({conf:.0%})")
-    
+        conf_indicator = _CONF_INDICATORS[bisect.bisect_right(_CONF_THRESHOLDS, conf)]
+        out.append(f"  {conf_indicator} {sample_id[:20]}... -> {persona_name} ({conf:.0%})")
+
+    if pending_writes:
+        write_samples_batch(pending_writes)
+        analyzed_ids.update(path.stem for path, _ in pending_writes)
+
     # Update persona counts
     if not dry_run:
+        registry = personas.get("personas", {})
         for persona_name, count in persona_counts.items():
-            if persona_name in personas.get("personas", {}):
-                personas["personas"][persona_name]["sample_count"] = \
-                    personas["personas"][persona_name].get("sample_count", 0) + count
+            if persona_name in registry:
+                entry = registry[persona_name]
+                entry["sample_count"] = entry.get("sample_count", 0) + count
         
-        personas["updated"] = datetime.now().isoformat()
+        personas["updated"] = now_iso
         save_json(PERSONA_FILE, personas)
     
     # Update state
     if not dry_run:
         state["batches_completed"] = state.get("batches_completed", 0) + 1
         state["total_samples"] = state.get("total_samples", 0) + saved_count
-        state["last_ingest"] = datetime.now().isoformat()
+        state["last_ingest"] = now_iso
         state["current_phase"] = "analysis"
         save_json(STATE_FILE, state)
     
     # Summary
-    print(f"\n{'=' * 50}")
-    print("INGEST COMPLETE" if not dry_run else "DRY RUN COMPLETE")
-    print(f"{'=' * 50}")
-    print(f"Samples processed: {saved_count}")
-    print(f"Personas: {', '.join(f'{k} ({v})' for k, v in persona_counts.items())}")
+    out.append(f"\n{'=' * 50}")
+    out.append("INGEST COMPLETE" if not dry_run else "DRY RUN COMPLETE")
+    out.append(f"{'=' * 50}")
+    out.append(f"Samples processed: {saved_count}")
+    out.append(f"Personas: {', '.join(f'{k} ({v})' for k, v in persona_counts.items())}")
 
     if not dry_run:
-        print(f"Total samples: {state['total_samples']}")
-        print(f"Batches completed: {state['batches_completed']}")
+        out.append(f"Total samples: {state['total_samples']}")
+        out.append(f"Batches completed: {state['batches_completed']}")
 
-    print(f"{'=' * 50}")
+    out.append(f"{'=' * 50}")
 
     # Check remaining clusters and provide guidance
     if not dry_run:
-        clusters_file = get_path("clusters.json")
+        clusters_data, _ = _load_clusters()
         remaining_clusters = 0
         total_clusters = 0
 
-        if clusters_file.exists():
-            with open(clusters_file) as f:
-                clusters_data = json.load(f)
-
+        if clusters_data:
             # Count clusters that still need analysis
-            analyzed_ids = set()
-            if SAMPLES_DIR.exists():
-                for f in SAMPLES_DIR.glob("*.json"):
-                    analyzed_ids.add(f.stem)
-
             for cluster in clusters_data.get('clusters', []):
                 if cluster.get('is_noise'):
                     continue
                 total_clusters += 1
-                sample_ids = cluster.get('sample_ids', [])
-                unanalyzed = [s for s in sample_ids if s not in analyzed_ids]
-                if unanalyzed:
+                if not analyzed_ids.issuperset(cluster.get('sample_ids', [])):
                     remaining_clusters += 1
 
         if remaining_clusters > 0:
-            print(f"\n[STATS] PROGRESS: {total_clusters - remaining_clusters}/{total_clusters} clusters analyzed")
-            print(f"\n[TIP] Next step:")
-            print(f"   Run: python prepare_batch.py")
-            print(f"   Remaining clusters: {remaining_clusters}")
+            out.append(f"\n[STATS] PROGRESS: {total_clusters - remaining_clusters}/{total_clusters} clusters analyzed")
+            out.append(f"\n[TIP] Next step:")
+            out.append(f"   Run: python prepare_batch.py")
+            out.append(f"   Remaining clusters: {remaining_clusters}")
         else:
             # Check for validation set
-            validation_dir = get_path("validation_set")
-            validation_count = len(list(validation_dir.glob("*.json"))) if validation_dir.exists() else 0
+            validation_count = sum(1 for name in _list_names(VALIDATION_DIR) if name.endswith(".json"))
 
-            print(f"\n{'=' * 60}")
-            print("[OK] ALL CLUSTERS ANALYZED!")
-            print(f"{'=' * 60}")
-            print(f"\nEmail personas are ready.")
+            out.append(f"\n{'=' * 60}")
+            out.append("[OK] ALL CLUSTERS ANALYZED!")
+            out.append(f"{'=' * 60}")
+            out.append(f"\nEmail personas are ready.")
 
             if validation_count > 0:
-                print(f"\n[STATS] VALIDATION DATA AVAILABLE: {validation_count} held-out emails")
-                print(f"\nRecommended next steps:")
-                print(f"   1. VALIDATE personas first (blind test):")
-                print(f"      python prepare_validation.py")
-                print(f"      python validate_personas.py --auto")
-                print(f"\n   2. THEN generate your writing clone skill:")
-                print(f"      python generate_skill.py --name <your-name>")
-                print(f"\n   3. Or add LinkedIn voice (optional):")
-                print(f"      python fetch_linkedin_mcp.py --profile \"URL\"")
+                out.append(f"\n[STATS] VALIDATION DATA AVAILABLE: {validation_count} held-out emails")
+                out.append(f"\nRecommended next steps:")
+                out.append(f"   1. VALIDATE personas first (blind test):")
+                out.append(f"      python prepare_validation.py")
+                out.append(f"      python validate_personas.py --auto")
+                out.append(f"\n   2. THEN generate your writing clone skill:")
+                out.append(f"      python generate_skill.py --name <your-name>")
+                out.append(f"\n   3. Or add LinkedIn voice (optional):")
+                out.append(f"      python fetch_linkedin_mcp.py --profile \"URL\"")
             else:
-                print(f"\nYou can now:")
-                print(f"   1. Generate your writing clone skill:")
-                print(f"      python generate_skill.py --name <your-name>")
-                print(f"   2. Or add LinkedIn voice first (optional):")
-                print(f"      python fetch_linkedin_mcp.py --profile \"URL\"")
-            print(f"{'=' * 60}")
+                out.append(f"\nYou can now:")
+                out.append(f"   1. Generate your writing clone skill:")
+                out.append(f"      python generate_skill.py --name <your-name>")
+                out.append(f"   2. Or add LinkedIn voice first (optional):")
+                out.append(f"      python fetch_linkedin_mcp.py --profile \"URL\"")
+            out.append(f"{'=' * 60}")
 
             # Session boundary - explicit STOP
-            print(f"\n{'█' * 60}")
-            print("█  STOP - EMAIL ANALYSIS COMPLETE                          █")
-            print("█                                                          █")
-            print("█  START A NEW CHAT before proceeding to:                  █")
-            print("█    - Validation (Session 2b: Judge)                      █")
-            print("█    - LinkedIn (Session 3)                                █")
-            print("█    - Generation (Session 4)                              █")
-            print("█                                                          █")
-            print("█  Reason: Clean context improves output quality.          █")
-            print(f"{'█' * 60}\n")
-
-    # Post-ingest validation
-    if not dry_run:
-        validate_ingest_result(batch, dry_run=dry_run)
+            out.append(f"\n{'█' * 60}")
+            out.append("█  STOP - EMAIL ANALYSIS COMPLETE                          █")
+            out.append("█                                                          █")
+            out.append("█  START A NEW CHAT before proceeding to:                  █")
+            out.append("█    - Validation (Session 2b: Judge)                      █")
+            out.append("█    - LinkedIn (Session 3)                                █")
+            out.append("█    - Generation (Session 4)                              █")
+            out.append("█                                                          █")
+            out.append("█  Reason: Clean context improves output quality.          █")
+            out.append(f"{'█' * 60}\n")
 
     return True
 
@@ -491,7 +651,7 @@ def show_status():
     personas = load_json(PERSONA_FILE)
     
     # Count actual sample files
-    sample_count = len(list(SAMPLES_DIR.glob("*.json"))) if SAMPLES_DIR.exists() else 0
+    sample_count = len(_list_sample_ids())
     
     print(f"\n{'=' * 50}")
     print("INGEST STATUS")
@@ -509,6 +669,8 @@ def show_status():
 
 
 if __name__ == "__main__":
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Ingest batch analysis results",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -517,6 +679,7 @@ Examples:
   python ingest.py batch_001.json           # Process a batch
   python ingest.py batch_001.json --dry-run # Preview without saving
   python ingest.py batch_001.json --force   # Bypass coverage validation
+  python ingest.py batch_001.json --quiet   # Process without the report
   python ingest.py --status                 # Show current status
         """
     )
@@ -524,6 +687,7 @@ Examples:
     parser.add_argument("--dry-run", action="store_true", help="Preview without saving")
     parser.add_argument("--force", "-f", action="store_true",
                         help="Bypass coverage validation (not recommended)")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Suppress the ingest report")
     parser.add_argument("--status", action="store_true", help="Show ingest status")
 
     args = parser.parse_args()
@@ -531,6 +695,7 @@ Examples:
     if args.status:
         show_status()
     elif args.batch_file:
-        ingest_batch(args.batch_file, dry_run=args.dry_run, force=args.force)
+        ingest_batch(args.batch_file, dry_run=args.dry_run, force=args.force,
+                     quiet=args.quiet)
     else:
         parser.print_help()
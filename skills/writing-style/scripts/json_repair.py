@@ -18,37 +18,84 @@ Usage:
         data = result['data']
     else:
         print(f"Failed: {result['error']}")
+
+    # Streaming: parse as soon as the JSON closes
+    parser = IncrementalJsonRepair()
+    for chunk in stream:
+        data = parser.feed(chunk)
 """
 
 import re
 import json
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union
 
 
-def extract_json_block(text: str) -> str:
+# Tokenizers for the structure scanners: a complete string literal (consumed
+# whole by the regex engine, escapes included), a bare quote (only matches
+# when the string is unterminated), or a bracket character. This lets the
+# scanners visit one token per string/bracket instead of every character.
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING_RE = re.compile(_STRING, re.DOTALL)
+_STRUCTURAL_RE = re.compile(_STRING + r'|["{}\[\]]', re.DOTALL)
+_OBJECT_TOKENS_RE = re.compile(_STRING + r'|["{}]', re.DOTALL)
+_ARRAY_TOKENS_RE = re.compile(_STRING + r'|["\[\]]', re.DOTALL)
+
+# repair_json's single pass also matches trailing commas (outside strings)
+_REPAIR_TOKENS_RE = re.compile(_STRING + r'|,(?=\s*[}\]])|["{}\[\]]', re.DOTALL)
+
+_CLOSERS = {'{': '}', '[': ']'}
+
+# repair_unescaped_quotes and IncrementalJsonRepair: characters that matter
+# inside a string, and the whitespace skipped when looking past a quote
+_STRING_SPECIAL_RE = re.compile(r'[\\"]')
+_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+
+# Keys every analysis sample must carry
+_REQUIRED_SAMPLE_KEYS = frozenset(('id', 'persona'))
+
+# Trailing comma before } or ], with optional whitespace in between
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+
+def _fenced_blocks(text: str):
     """
-    Extract JSON from text that may contain markdown fences or surrounding text.
+    Yield the contents of each ``` fenced block, in order.
 
-    Handles:
-    - ```json ... ```
-    - ``` ... ```
-    - JSON embedded in prose
-    - Multiple JSON blocks (returns first valid one)
+    A linear str.find walk over fence markers; an optional "json" language
+    tag after the opening fence is skipped. Unclosed fences yield nothing.
+    """
+    pos = 0
+    while True:
+        start = text.find('```', pos)
+        if start == -1:
+            return
+        body = start + 3
+        if text.startswith('json', body):
+            body += 4
+        close = text.find('```', body)
+        if close == -1:
+            return
+        yield text[body:close]
+        pos = close + 3
+
+
+def _locate_json(text: str) -> Tuple[str, int, Optional[str]]:
+    """
+    Find where the JSON in an LLM response starts.
 
     Returns:
-        Extracted JSON string (may still need repair)
+        (text, start, open_char): the fence-stripped text, the index of the
+        outermost { or [, and that character. open_char is None when a fenced
+        JSON block or no structure was found; the whole text is used then.
     """
     text = text.strip()
 
     # Pattern 1: ```json ... ``` or ``` ... ```
-    fence_pattern = r'```(?:json)?\s*\n?(.*?)```'
-    matches = re.findall(fence_pattern, text, re.DOTALL)
-    if matches:
-        # Try each match to find valid JSON
-        for match in matches:
-            cleaned = match.strip()
-            if cleaned.startswith('{') or cleaned.startswith('['):
-                return cleaned
+    # Try each fenced block to find valid JSON
+    for block in _fenced_blocks(text):
+        cleaned = block.strip()
+        if cleaned.startswith('{') or cleaned.startswith('['):
+            return cleaned, 0, None
 
     # Pattern 2: Remove markdown fences at start/end only
     if text.startswith("```json"):
@@ -65,55 +112,46 @@ def extract_json_block(text: str) -> str:
     first_bracket = text.find('[')
 
     if first_brace == -1 and first_bracket == -1:
-        return text  # No JSON structure found, return as-is
+        return text, 0, None  # No JSON structure found, use as-is
 
     # Determine which comes first
-    if first_brace == -1:
-        start = first_bracket
-        open_char, close_char = '[', ']'
-    elif first_bracket == -1:
-        start = first_brace
-        open_char, close_char = '{', '}'
-    else:
-        if first_brace < first_bracket:
-            start = first_brace
-            open_char, close_char = '{', '}'
-        else:
-            start = first_bracket
-            open_char, close_char = '[', ']'
+    if first_bracket == -1 or (first_brace != -1 and first_brace < first_bracket):
+        return text, first_brace, '{'
+    return text, first_bracket, '['
 
-    # Find matching close (accounting for nesting)
-    depth = 0
-    in_string = False
-    escape_next = False
-    end = start
 
-    for i, char in enumerate(text[start:], start):
-        if escape_next:
-            escape_next = False
-            continue
+def extract_json_block(text: str) -> str:
+    """
+    Extract JSON from text that may contain markdown fences or surrounding text.
 
-        if char == '\\' and in_string:
-            escape_next = True
-            continue
+    Handles:
+    - ```json ... ```
+    - ``` ... ```
+    - JSON embedded in prose
+    - Multiple JSON blocks (returns first valid one)
 
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
+    Returns:
+        Extracted JSON string (may still need repair)
+    """
+    text, start, open_char = _locate_json(text)
+    if open_char is None:
+        return text
+    close_char = _CLOSERS[open_char]
 
-        if in_string:
-            continue
+    # Find matching close (accounting for nesting and strings)
+    tokens = _OBJECT_TOKENS_RE if open_char == '{' else _ARRAY_TOKENS_RE
+    depth = 0
 
+    for match in tokens.finditer(text, start):
+        char = match.group()
         if char == open_char:
             depth += 1
         elif char == close_char:
             depth -= 1
             if depth == 0:
-                end = i + 1
-                break
-
-    if end > start:
-        return text[start:end]
+                return text[start:match.end()]
+        elif char == '"':
+            break  # Unterminated string runs to the end of the text
 
     # If no matching close found, return from start to end
     return text[start:]
@@ -121,10 +159,8 @@ def extract_json_block(text: str) -> str:
 
 def repair_trailing_commas(text: str) -> str:
     """Remove trailing commas before } or ]."""
-    # Remove trailing commas before closing braces/brackets
     # Handle: ,} or ,] with optional whitespace
-    text = re.sub(r',(\s*[}\]])', r'\1', text)
-    return text
+    return _TRAILING_COMMA_RE.sub(r'\1', text)
 
 
 def repair_truncated_json(text: str) -> str:
@@ -133,41 +169,19 @@ def repair_truncated_json(text: str) -> str:
 
     This is a best-effort repair for responses cut off mid-JSON.
     """
-    # Count unmatched braces and brackets
-    open_braces = 0
-    open_brackets = 0
-    in_string = False
-    escape_next = False
-
-    for char in text:
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == '\\' and in_string:
-            escape_next = True
-            continue
-
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if char == '{':
-            open_braces += 1
-        elif char == '}':
-            open_braces -= 1
-        elif char == '[':
-            open_brackets += 1
-        elif char == ']':
-            open_brackets -= 1
-
-    # Check if we're in an unclosed string
-    if in_string:
+    # Drop complete strings so every remaining bracket is structural and
+    # str.count can tally them in C; a leftover quote opens a string that
+    # runs to the end of the text
+    skeleton = _STRING_RE.sub('', text)
+    cut = skeleton.find('"')
+    if cut != -1:
+        skeleton = skeleton[:cut]
         text += '"'
 
+    # Count unmatched braces and brackets
+    open_brackets = skeleton.count('[') - skeleton.count(']')
+    open_braces = skeleton.count('{') - skeleton.count('}')
+
     # Add missing closing brackets/braces
     # Order matters: close arrays before objects (inner to outer)
     text += ']' * max(0, open_brackets)
@@ -185,45 +199,48 @@ def repair_unescaped_quotes(text: str) -> str:
     # This is a simplified approach - only handles obvious cases
     # For complex cases, manual intervention may be needed
 
-    # Find strings and check for unescaped quotes
+    # Find strings and check for unescaped quotes. Plain runs of text are
+    # copied as slices; only backslashes and quotes are handled one by one.
     result = []
     i = 0
+    n = len(text)
     in_string = False
-    string_start = -1
 
-    while i < len(text):
-        char = text[i]
-
-        if char == '\\' and in_string:
-            # Skip escaped character
-            result.append(text[i:i+2])
-            i += 2
+    while i < n:
+        if not in_string:
+            quote = text.find('"', i)
+            if quote == -1:
+                result.append(text[i:])
+                break
+            result.append(text[i:quote + 1])
+            in_string = True
+            i = quote + 1
             continue
 
-        if char == '"':
-            if not in_string:
-                in_string = True
-                string_start = i
-                result.append(char)
-            else:
-                # Check if this quote is followed by a structural character
-                # If so, it's likely a real string end
-                next_i = i + 1
-                while next_i < len(text) and text[next_i] in ' \t\n\r':
-                    next_i += 1
-
-                if next_i >= len(text) or text[next_i] in ':,}]':
-                    # Real string end
-                    in_string = False
-                    result.append(char)
-                else:
-                    # Possibly unescaped quote inside string - escape it
-                    result.append('\\"')
-            i += 1
+        match = _STRING_SPECIAL_RE.search(text, i)
+        if match is None:
+            result.append(text[i:])
+            break
+        j = match.start()
+        result.append(text[i:j])
+
+        if text[j] == '\\':
+            # Skip escaped character
+            result.append(text[j:j + 2])
+            i = j + 2
             continue
 
-        result.append(char)
-        i += 1
+        # Check if this quote is followed by a structural character
+        # If so, it's likely a real string end
+        next_i = _WHITESPACE_RE.match(text, j + 1).end()
+        if next_i >= n or text[next_i] in ':,}]':
+            # Real string end
+            in_string = False
+            result.append('"')
+        else:
+            # Possibly unescaped quote inside string - escape it
+            result.append('\\"')
+        i = j + 1
 
     return ''.join(result)
 
@@ -232,27 +249,65 @@ def repair_json(text: str) -> str:
     """
     Apply all repair strategies to malformed JSON.
 
+    Extraction, trailing-comma removal and truncation repair run as one
+    pass over the text: the scan that finds the end of the JSON block also
+    drops trailing commas and counts unclosed brackets/braces.
+
     Returns:
         Repaired JSON string (may still be invalid)
     """
-    # Step 1: Extract JSON block from surrounding text
-    text = extract_json_block(text)
+    text, start, open_char = _locate_json(text)
+    close_char = _CLOSERS.get(open_char)
 
-    # Step 2: Remove trailing commas
-    text = repair_trailing_commas(text)
+    pieces = []
+    keep_from = start
+    end = len(text)
+    depth = open_braces = open_brackets = 0
+    in_string = False
 
-    # Step 3: Repair truncated JSON
-    text = repair_truncated_json(text)
+    for match in _REPAIR_TOKENS_RE.finditer(text, start):
+        char = match.group()
+        if char == ',':
+            # Trailing comma: copy up to it and skip it
+            pieces.append(text[keep_from:match.start()])
+            keep_from = match.end()
+            continue
+        if char == '"':
+            in_string = True  # Unterminated string runs to the end of the text
+            break
 
-    return text
+        if char == '{':
+            open_braces += 1
+        elif char == '}':
+            open_braces -= 1
+        elif char == '[':
+            open_brackets += 1
+        elif char == ']':
+            open_brackets -= 1
+
+        if char == open_char:
+            depth += 1
+        elif char == close_char:
+            depth -= 1
+            if depth == 0:
+                end = match.end()
+                break
 
+    pieces.append(text[keep_from:end])
+    if in_string:
+        pieces.append('"')
+    # Order matters: close arrays before objects (inner to outer)
+    pieces.append(']' * max(0, open_brackets))
+    pieces.append('}' * max(0, open_braces))
+    return ''.join(pieces)
 
-def safe_parse_json(text: str, strict: bool = False) -> Dict[str, Any]:
+
+def safe_parse_json(text: Union[str, bytes], strict: bool = False) -> Dict[str, Any]:
     """
     Safely parse JSON from LLM response with multiple repair attempts.
 
     Args:
-        text: Raw LLM response
+        text: Raw LLM response (bytes are decoded once, as json.loads does)
         strict: If True, don't attempt repairs (just extract)
 
     Returns:
@@ -271,6 +326,9 @@ def safe_parse_json(text: str, strict: bool = False) -> Dict[str, Any]:
         'raw_extracted': None
     }
 
+    if isinstance(text, bytes):
+        text = text.decode(json.detect_encoding(text), 'surrogatepass')
+
     # Attempt 1: Extract and parse without repair
     extracted = extract_json_block(text)
     result['raw_extracted'] = extracted
@@ -283,30 +341,148 @@ def safe_parse_json(text: str, strict: bool = False) -> Dict[str, Any]:
         if strict:
             result['error'] = f"JSON parse error: {str(e)}"
             return result
+        error = e
+
+    # Each repair is only re-parsed if it can change the outcome: a repair
+    # that leaves the text as-is fails exactly like the last attempt, and
+    # dropping commas cannot terminate an unterminated string.
 
     # Attempt 2: Apply trailing comma repair
     repaired = repair_trailing_commas(extracted)
-    try:
-        result['data'] = json.loads(repaired)
-        result['success'] = True
-        result['repair_applied'] = True
-        return result
-    except json.JSONDecodeError:
-        pass
+    comma_attempted = repaired != extracted and not error.msg.startswith('Unterminated string')
+    if comma_attempted:
+        try:
+            result['data'] = json.loads(repaired)
+            result['success'] = True
+            result['repair_applied'] = True
+            return result
+        except json.JSONDecodeError as e:
+            error = e
 
     # Attempt 3: Apply truncation repair
-    repaired = repair_truncated_json(repaired)
-    try:
-        result['data'] = json.loads(repaired)
-        result['success'] = True
-        result['repair_applied'] = True
-        return result
-    except json.JSONDecodeError as e:
-        result['error'] = f"JSON parse error after repairs: {str(e)}"
+    truncated = repair_truncated_json(repaired)
+    if truncated != repaired:
+        try:
+            result['data'] = json.loads(truncated)
+            result['success'] = True
+            result['repair_applied'] = True
+            return result
+        except json.JSONDecodeError as e:
+            error = e
+    elif repaired != extracted and not comma_attempted:
+        # Attempt 2 was skipped but the repaired text is what failed last
+        try:
+            json.loads(repaired)
+        except json.JSONDecodeError as e:
+            error = e
+
+    result['error'] = f"JSON parse error after repairs: {str(error)}"
 
     return result
 
 
+class IncrementalJsonRepair:
+    """
+    Parse a streamed LLM response as it arrives.
+
+    feed() returns the parsed JSON as soon as the first top-level object or
+    array closes, and None until then. If the stream ends first, finish()
+    parses everything received with safe_parse_json's repairs.
+
+    Usage:
+        parser = IncrementalJsonRepair()
+        for chunk in stream:
+            data = parser.feed(chunk)
+            if data is not None:
+                break
+        else:
+            result = parser.finish()
+    """
+
+    def __init__(self):
+        self._chunks = []           # everything fed, for finish()
+        self._json = []             # scanned text from the opening bracket on
+        self._in_string = False     # last chunk ended inside a string
+        self._escape = False        # ... right after a backslash
+        self._started = False
+        self._depth = 0
+        self._result = None         # safe_parse_json result once closed
+
+    def feed(self, chunk: str) -> Optional[Any]:
+        """Add a chunk; return the parsed JSON once it is complete."""
+        if self._result is not None:
+            return self._result['data']
+        self._chunks.append(chunk)
+        text = chunk
+
+        if not self._started:
+            starts = [i for i in (text.find('{'), text.find('[')) if i != -1]
+            if not starts:
+                return None
+            text = text[min(starts):]
+            self._started = True
+
+        pos = 0
+        if self._in_string:
+            pos = self._skip_string(text, 0)
+            if pos == -1:
+                self._json.append(text)
+                return None
+            self._in_string = False
+
+        for match in _STRUCTURAL_RE.finditer(text, pos):
+            token = match.group()
+            if token == '"':
+                # String not closed yet: carry on from the end of this chunk
+                # next time instead of rescanning it from its quote
+                self._in_string = True
+                self._escape = False
+                self._skip_string(text, match.end())
+                self._json.append(text)
+                return None
+            if token == '{' or token == '[':
+                self._depth += 1
+            elif token == '}' or token == ']':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._json.append(text[:match.end()])
+                    self._result = safe_parse_json(''.join(self._json))
+                    return self._result['data']
+
+        self._json.append(text)
+        return None
+
+    def _skip_string(self, text: str, pos: int) -> int:
+        """
+        Continue an open string at text[pos:].
+
+        Returns the index just past its closing quote, or -1 if the string is
+        still open at the end of text (with _escape set if text ends in the
+        middle of an escape sequence).
+        """
+        if self._escape:
+            if pos >= len(text):
+                return -1
+            pos += 1
+            self._escape = False
+        while True:
+            match = _STRING_SPECIAL_RE.search(text, pos)
+            if match is None:
+                return -1
+            if match.group() == '"':
+                return match.end()
+            if match.end() == len(text):
+                self._escape = True
+                return -1
+            pos = match.end() + 1
+
+    def finish(self) -> Dict[str, Any]:
+        """Return the safe_parse_json result for the stream received so far."""
+        if self._result is not None:
+            return self._result
+        return safe_parse_json(''.join(self._chunks))
+
+
 def validate_analysis_schema(data: Dict) -> Tuple[bool, str]:
     """
     Validate that parsed JSON matches expected analysis schema.
@@ -324,11 +500,17 @@ def validate_analysis_schema(data: Dict) -> Tuple[bool, str]:
     if not isinstance(data['samples'], list):
         return False, "'samples' must be an array"
 
-    if len(data['samples']) == 0:
+    samples = data['samples']
+    if len(samples) == 0:
         return False, "'samples' array is empty"
 
-    # Validate sample structure
-    for i, sample in enumerate(data['samples']):
+    # Fast path: one subset check per sample when everything is valid
+    if all(isinstance(sample, dict) and _REQUIRED_SAMPLE_KEYS <= sample.keys()
+           for sample in samples):
+        return True, ""
+
+    # Validate sample structure (find the first problem for the error message)
+    for i, sample in enumerate(samples):
         if not isinstance(sample, dict):
             return False, f"Sample {i} is not an object"
         if 'id' not in sample:
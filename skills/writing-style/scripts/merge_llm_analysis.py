@@ -25,13 +25,28 @@ import json
 import sys
 import argparse
 from pathlib import Path
-from copy import deepcopy
 
 from config import get_path
+from json_repair import safe_parse_json
+# Same serializer as ingest: orjson only for pure-ASCII data, checked
+# before serializing, otherwise json.dumps(indent=2)
+from ingest import _dumps
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 PERSONA_FILE = get_path("linkedin_persona.json")
 
 
+def _flush_log(log: list) -> None:
+    """Write buffered merge diagnostics in a single call."""
+    if log:
+        sys.stdout.write('\n'.join(log) + '\n')
+
+
 def load_persona() -> dict:
     """Load current linkedin_persona.json."""
     if not PERSONA_FILE.exists():
@@ -39,8 +54,10 @@ def load_persona() -> dict:
         print("Run cluster_linkedin.py first.")
         sys.exit(1)
 
-    with open(PERSONA_FILE) as f:
-        return json.load(f)
+    data = PERSONA_FILE.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def load_llm_output(source: str) -> dict:
@@ -52,53 +69,76 @@ def load_llm_output(source: str) -> dict:
         if not path.exists():
             print(f"Error: File not found: {source}")
             sys.exit(1)
-        with open(path) as f:
-            content = f.read()
-
-    # Handle markdown code blocks (common when copying from LLMs)
-    content = content.strip()
-    if content.startswith('```json'):
-        content = content[7:]
-    if content.startswith('```'):
-        content = content[3:]
-    if content.endswith('```'):
-        content = content[:-3]
-    content = content.strip()
-
-    try:
-        return json.loads(content)
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in LLM output: {e}")
+        # Raw bytes: safe_parse_json decodes them as UTF-8 (or UTF-16/32),
+        # whatever the platform's default encoding
+        content = path.read_bytes()
+
+    # Handles markdown code blocks (common when copying from LLMs) and
+    # repairs trailing commas / truncation in the same pass
+    result = safe_parse_json(content)
+    if not result['success']:
+        print(f"Error: Invalid JSON in LLM output: {result['error']}")
         print("First 500 chars of content:")
-        print(content[:500])
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', 'replace')
+        print(content.strip()[:500])
         sys.exit(1)
+    if result['repair_applied']:
+        print("Note: repaired malformed JSON in LLM output")
+
+    return result['data']
+
+
+def _copy_json(data):
+    """Deep-copy JSON-shaped data with a serialize/parse round trip."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(orjson.dumps(data))
+    return json.loads(json.dumps(data))
+
+
+def _short(value, limit: int = 60) -> str:
+    """JSON form of value cut to limit chars; long strings are cut before encoding."""
+    if isinstance(value, str):
+        value = value[:limit]
+    return json.dumps(value)[:limit]
 
 
 def is_empty_or_placeholder(value) -> bool:
     """Check if a value is empty/placeholder and should be overwritten."""
-    if value is None:
-        return True
-    if isinstance(value, str) and value.strip() == "":
-        return True
-    if isinstance(value, list) and len(value) == 0:
-        return True
-    if isinstance(value, dict) and len(value) == 0:
-        return True
-    return False
+    # Parsed JSON never holds str/list/dict subclasses, so exact type checks
+    # are enough
+    if type(value) is str:
+        return not value.strip()
+    if value:
+        return False
+    # 0 and False are real values, not placeholders
+    return value is None or type(value) is list or type(value) is dict
 
 
 def merge_positive_examples(base_examples: list, llm_examples: list) -> list:
-    """Merge LLM annotations into positive examples using index matching."""
-    result = deepcopy(base_examples)
+    """
+    Merge LLM annotations into positive examples using index matching.
+    Updates base_examples in place and returns it.
+    """
+    log = []
+    try:
+        return _merge_positive_into(base_examples, llm_examples, log)
+    finally:
+        _flush_log(log)
+
+
+def _merge_positive_into(base_examples: list, llm_examples: list, log: list) -> list:
+    """Body of merge_positive_examples; diagnostics go to the caller's log."""
+    result = base_examples
 
     for llm_ex in llm_examples:
         idx = llm_ex.get('index')
         if idx is None:
-            print(f"Warning: LLM example missing 'index', skipping: {llm_ex}")
+            log.append(f"Warning: LLM example missing 'index', skipping: {llm_ex}")
             continue
 
         if idx < 0 or idx >= len(result):
-            print(f"Warning: Index {idx} out of range (0-{len(result)-1}), skipping")
+            log.append(f"Warning: Index {idx} out of range (0-{len(result)-1}), skipping")
             continue
 
         # Merge fields into the existing example
@@ -107,7 +147,7 @@ def merge_positive_examples(base_examples: list, llm_examples: list) -> list:
             if field in llm_ex and not is_empty_or_placeholder(llm_ex[field]):
                 if is_empty_or_placeholder(target.get(field)):
                     target[field] = llm_ex[field]
-                    print(f"  + example[{idx}].{field} = {json.dumps(llm_ex[field])[:60]}...")
+                    log.append(f"  + example[{idx}].{field} = {_short(llm_ex[field])}...")
 
     return result
 
@@ -117,8 +157,18 @@ def deep_merge(base: dict, overlay: dict, path: str = "") -> dict:
     Merge overlay into base, preferring overlay for non-empty values.
     Only overwrites if base value is empty/placeholder.
     """
-    result = deepcopy(base)
+    result = _copy_json(base)
+    # Diagnostics are buffered and written in one call at the end
+    log = []
+    try:
+        _merge_into(result, overlay, path, log)
+    finally:
+        _flush_log(log)
+    return result
+
 
+def _merge_into(result: dict, overlay: dict, path: str, log: list) -> None:
+    """Recursive body of deep_merge; mutates the already-copied result."""
     for key, overlay_value in overlay.items():
         current_path = f"{path}.{key}" if path else key
         base_value = result.get(key)
@@ -130,7 +180,7 @@ def deep_merge(base: dict, overlay: dict, path: str = "") -> dict:
         # Special handling for example_bank.positive (uses index-based matching)
         if current_path == 'example_bank.positive':
             if isinstance(overlay_value, list) and isinstance(base_value, list):
-                result[key] = merge_positive_examples(base_value, overlay_value)
+                result[key] = _merge_positive_into(base_value, overlay_value, log)
             continue
 
         # Special handling for example_bank.negative (append/replace empty array)
@@ -138,7 +188,7 @@ def deep_merge(base: dict, overlay: dict, path: str = "") -> dict:
             if isinstance(overlay_value, list) and len(overlay_value) > 0:
                 if is_empty_or_placeholder(base_value):
                     result[key] = overlay_value
-                    print(f"  + {current_path} = [{len(overlay_value)} items]")
+                    log.append(f"  + {current_path} = [{len(overlay_value)} items]")
             continue
 
         # If overlay value is empty, skip it
@@ -147,23 +197,21 @@ def deep_merge(base: dict, overlay: dict, path: str = "") -> dict:
 
         # If both are dicts, recurse
         if isinstance(base_value, dict) and isinstance(overlay_value, dict):
-            result[key] = deep_merge(base_value, overlay_value, current_path)
+            _merge_into(base_value, overlay_value, current_path, log)
 
         # If base is empty/placeholder, replace with overlay
         elif is_empty_or_placeholder(base_value):
             result[key] = overlay_value
             if isinstance(overlay_value, list):
-                print(f"  + {current_path} = [{len(overlay_value)} items]")
+                log.append(f"  + {current_path} = [{len(overlay_value)} items]")
             elif isinstance(overlay_value, str) and len(overlay_value) > 50:
-                print(f"  + {current_path} = \"{overlay_value[:47]}...\"")
+                log.append(f"  + {current_path} = \"{overlay_value[:47]}...\"")
             else:
-                print(f"  + {current_path} = {json.dumps(overlay_value)}")
+                log.append(f"  + {current_path} = {json.dumps(overlay_value)}")
 
         # If base has value and overlay has value, log but don't overwrite
         else:
-            print(f"  ~ {current_path}: keeping existing value (use --force to overwrite)")
-
-    return result
+            log.append(f"  ~ {current_path}: keeping existing value (use --force to overwrite)")
 
 
 def validate_structure(persona: dict) -> list:
@@ -236,7 +284,6 @@ def main():
     # Load data
     print("Loading current persona...")
     persona = load_persona()
-    original = deepcopy(persona)
 
     print(f"Loading LLM output from {'stdin' if args.input == '-' else args.input}...")
     llm_output = load_llm_output(args.input)
@@ -267,8 +314,7 @@ def main():
         print("\n[DRY RUN] Would write to:", PERSONA_FILE)
         print("Run without --dry-run to apply changes.")
     else:
-        with open(PERSONA_FILE, 'w') as f:
-            json.dump(merged, f, indent=2)
+        PERSONA_FILE.write_text(_dumps(merged))
         print(f"\n[OK] Saved merged persona to: {PERSONA_FILE}")
 
     return 0
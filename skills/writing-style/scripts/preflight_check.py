@@ -15,8 +15,14 @@ import platform
 import subprocess
 import importlib.util
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Windows compatibility: ensure local imports work. Done once here rather than
+# inside check_data_dir, since the checks run concurrently and the others
+# read sys.path.
+sys.path.insert(0, str(Path(__file__).parent))
+
 
 def check_python():
     """
@@ -120,22 +126,17 @@ def check_data_dir():
         tuple: (success: bool, message: str)
     """
     # Import config to get data directory
-    scripts_dir = Path(__file__).parent
-    sys.path.insert(0, str(scripts_dir))
-    try:
-        from config import get_data_dir
-        data_dir = get_data_dir()
+    from config import get_data_dir
+    data_dir = get_data_dir()
 
-        # Try to create if it doesn't exist
-        try:
-            data_dir.mkdir(parents=True, exist_ok=True)
-            return True, f"Data dir: {data_dir}"
-        except PermissionError:
-            return False, f"Cannot create data directory: {data_dir}"
-        except Exception as e:
-            return False, f"Data directory error: {e}"
-    finally:
-        sys.path.pop(0)
+    # Try to create if it doesn't exist
+    try:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        return True, f"Data dir: {data_dir}"
+    except PermissionError:
+        return False, f"Cannot create data directory: {data_dir}"
+    except Exception as e:
+        return False, f"Data directory error: {e}"
 
 
 def run_preflight(quiet=False):
@@ -163,18 +164,23 @@ def run_preflight(quiet=False):
 
     all_passed = True
 
-    for name, check_fn in checks:
-        try:
-            passed, message = check_fn()
-        except Exception as e:
-            passed = False
-            message = f"Check failed: {e}"
-
-        if not passed:
-            all_passed = False
-            print(f"[ERROR] {name}: {message}")
-        elif not quiet:
-            print(f"[OK] {name}: {message}")
+    # The checks are independent and mostly wait on I/O (the npx probe can
+    # take seconds), so run them concurrently and report in the listed order
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [(name, executor.submit(check_fn)) for name, check_fn in checks]
+
+        for name, future in futures:
+            try:
+                passed, message = future.result()
+            except Exception as e:
+                passed = False
+                message = f"Check failed: {e}"
+
+            if not passed:
+                all_passed = False
+                print(f"[ERROR] {name}: {message}")
+            elif not quiet:
+                print(f"[OK] {name}: {message}")
 
     print("=" * 50)
 
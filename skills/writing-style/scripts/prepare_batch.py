@@ -18,57 +18,98 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import os
 import json
 import argparse
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from fnmatch import fnmatch
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 # Directories
 from config import get_data_dir, get_path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
 DATA_DIR = get_data_dir()
 CLUSTERS_FILE = get_path("clusters.json")
 ENRICHED_DIR = get_path("enriched_samples")
 RAW_DIR = get_path("raw_samples")
 BATCHES_DIR = get_path("batches")
 SAMPLES_DIR = get_path("samples")
+ANALYZED_INDEX_FILE = get_path(".analyzed_index.json")
 
 # Calibration reference path (in skill repo)
 SKILL_DIR = Path(__file__).parent.parent
 CALIBRATION_FILE = SKILL_DIR / "references" / "calibration.md"
 
 
+def load_json_file(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    data = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _urlsafe_b64decode(data: str) -> bytes:
+    """Decode Gmail's URL-safe base64 body data (SIMD decoder when available)."""
+    if PYBASE64_AVAILABLE:
+        return pybase64.urlsafe_b64decode(data)
+    return base64.urlsafe_b64decode(data)
+
+
+def _find_text_part(parts: list) -> Optional[str]:
+    """First text/plain part that decodes, in document order.
+
+    Depth-first (a part before its children, children before later
+    siblings), using an explicit stack instead of recursion. Only text/plain
+    parts are decoded; everything else is just checked for children.
+    """
+    stack = list(reversed(parts))
+    while stack:
+        part = stack.pop()
+        if part.get('mimeType') == 'text/plain':
+            body_data = part.get('body', {}).get('data', '')
+            if body_data:
+                try:
+                    text = _urlsafe_b64decode(body_data).decode('utf-8')
+                    if text:
+                        return text
+                except:
+                    pass
+        children = part.get('parts')
+        if children:
+            stack.extend(reversed(children))
+    return None
+
+
 def extract_body(email_data: dict) -> str:
     """Extract plain text body from email data."""
     payload = email_data.get('payload', {})
-    
-    def find_text_part(parts):
-        for part in parts:
-            mime_type = part.get('mimeType', '')
-            if mime_type == 'text/plain':
-                body_data = part.get('body', {}).get('data', '')
-                if body_data:
-                    try:
-                        return base64.urlsafe_b64decode(body_data).decode('utf-8')
-                    except:
-                        pass
-            if 'parts' in part:
-                result = find_text_part(part['parts'])
-                if result:
-                    return result
-        return None
-    
+
     if 'parts' in payload:
-        body = find_text_part(payload['parts'])
+        body = _find_text_part(payload['parts'])
         if body:
             return body
     
     body_data = payload.get('body', {}).get('data', '')
     if body_data:
         try:
-            return base64.urlsafe_b64decode(body_data).decode('utf-8')
+            return _urlsafe_b64decode(body_data).decode('utf-8')
         except:
             pass
     
@@ -84,40 +125,129 @@ def get_header(email_data: dict, header_name: str) -> str:
     return ''
 
 
-def get_analyzed_ids() -> set:
-    """Get set of already-analyzed email IDs."""
+def _header_map(email_data: dict) -> Dict[str, str]:
+    """Map lower-cased header names to values; the first occurrence wins, as
+    in get_header."""
+    headers = {}
+    for header in email_data.get('payload', {}).get('headers', []):
+        headers.setdefault(header.get('name', '').lower(), header.get('value', ''))
+    return headers
+
+
+def _analyzed_ids_signature() -> tuple:
+    """Stat fingerprint of everything get_analyzed_ids reads.
+
+    Adding or removing a sample changes the samples dir mtime; batch files
+    are tracked individually so in-place edits are seen too.
+    """
+    try:
+        samples_mtime = SAMPLES_DIR.stat().st_mtime_ns
+    except OSError:
+        samples_mtime = None
+    batches = []
+    try:
+        with os.scandir(BATCHES_DIR) as entries:
+            for entry in entries:
+                if fnmatch(entry.name, 'batch_*.json'):
+                    st = entry.stat()
+                    batches.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return samples_mtime, tuple(sorted(batches))
+
+
+def _read_batch_ids(path: Path) -> set:
+    """Sample IDs listed in one batch file (empty if it cannot be read).
+
+    Samples without an id are skipped rather than recorded as ''.
+    """
+    ids = set()
+    try:
+        batch = load_json_file(path)
+        ids.update(filter(None, (sample.get('id') for sample in batch.get('samples', []))))
+    except:
+        pass
+    return ids
+
+
+def _batch_ids(batches_dir: Path, batches: tuple) -> set:
+    """IDs from the given batch files, reusing the on-disk index entry of
+    every file whose mtime and size are unchanged."""
+    try:
+        index = load_json_file(ANALYZED_INDEX_FILE)
+        cached = index['batches'] if index.get('batches_dir') == str(batches_dir) else {}
+    except Exception:
+        cached = {}
+
+    entries = {}
     analyzed = set()
-    
+    for name, mtime_ns, size in batches:
+        entry = cached.get(name)
+        if not (isinstance(entry, dict) and entry.get('mtime_ns') == mtime_ns
+                and entry.get('size') == size and isinstance(entry.get('ids'), list)):
+            entry = {'mtime_ns': mtime_ns, 'size': size,
+                     'ids': list(_read_batch_ids(batches_dir / name))}
+        entries[name] = entry
+        analyzed.update(entry['ids'])
+
+    if entries != cached:
+        tmp_path = ANALYZED_INDEX_FILE.with_name(ANALYZED_INDEX_FILE.name + '.tmp')
+        try:
+            tmp_path.write_text(json.dumps({'batches_dir': str(batches_dir), 'batches': entries}))
+            os.replace(tmp_path, ANALYZED_INDEX_FILE)
+        except OSError:
+            pass  # The index is only a cache
+
+    return analyzed
+
+
+@lru_cache(maxsize=1)
+def _analyzed_ids_cached(samples_dir: Path, batches_dir: Path, signature: tuple) -> frozenset:
+    analyzed = set()
+    samples_mtime, batches = signature
+
     # Check samples directory
-    if SAMPLES_DIR.exists():
-        for f in SAMPLES_DIR.glob('*.json'):
+    if samples_mtime is not None:
+        for f in samples_dir.glob('*.json'):
             analyzed.add(f.stem)
-    
+
     # Check batches for submitted analyses
-    if BATCHES_DIR.exists():
-        for batch_file in BATCHES_DIR.glob('batch_*.json'):
-            try:
-                with open(batch_file) as f:
-                    batch = json.load(f)
-                for sample in batch.get('samples', []):
-                    analyzed.add(sample.get('id', ''))
-            except:
-                continue
-    
-    return analyzed
+    analyzed |= _batch_ids(batches_dir, batches)
+
+    return frozenset(analyzed)
+
+
+def get_analyzed_ids() -> set:
+    """Get set of already-analyzed email IDs.
+
+    Cached within a run until the samples or batch files change, since
+    several commands ask for it more than once.
+    """
+    return set(_analyzed_ids_cached(SAMPLES_DIR, BATCHES_DIR, _analyzed_ids_signature()))
+
+
+@lru_cache(maxsize=1)
+def _load_cluster_data_cached(path: Path, mtime_ns: int, size: int) -> Dict:
+    return load_json_file(path)
 
 
 def load_cluster_data() -> Optional[Dict]:
-    """Load cluster assignments."""
-    if not CLUSTERS_FILE.exists():
+    """Load cluster assignments.
+
+    Cached on the file's mtime and size, so the several commands that call
+    this in one run parse clusters.json once. Callers must not mutate the
+    result.
+    """
+    try:
+        st = os.stat(CLUSTERS_FILE)
+    except FileNotFoundError:
         return None
-    
-    with open(CLUSTERS_FILE) as f:
-        return json.load(f)
+    return _load_cluster_data_cached(CLUSTERS_FILE, st.st_mtime_ns, st.st_size)
 
 
+@lru_cache(maxsize=1)
 def load_calibration() -> str:
-    """Load calibration reference content."""
+    """Load calibration reference content (a static file, read once)."""
     if CALIBRATION_FILE.exists():
         with open(CALIBRATION_FILE) as f:
             return f.read()
@@ -141,8 +271,9 @@ def format_email_for_analysis(email_id: str, enriched_data: Dict) -> Dict:
     enrichment = enriched_data.get('enrichment', {})
     quality = enriched_data.get('quality', {})
     
-    subject = get_header(email_data, 'subject')
-    to_header = get_header(email_data, 'to')
+    headers = _header_map(email_data)
+    subject = headers.get('subject', '')
+    to_header = headers.get('to', '')
     body = extract_body(email_data)
     
     return {
@@ -161,6 +292,31 @@ def format_email_for_analysis(email_id: str, enriched_data: Dict) -> Dict:
     }
 
 
+def _map_threaded(fn, items: list) -> list:
+    """Apply fn to each item on a thread pool (file loads), keeping order."""
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(16, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+def _load_enriched_email(email_id: str) -> Optional[Dict]:
+    """Load and format one enriched email, or None if it has no enriched file."""
+    try:
+        enriched_data = load_json_file(ENRICHED_DIR / f"{email_id}.json")
+    except FileNotFoundError:
+        return None
+    return format_email_for_analysis(email_id, enriched_data)
+
+
+def _load_sample_email(filepath: Path) -> Optional[Dict]:
+    """Load and format one sample file, or None if it cannot be read."""
+    try:
+        return format_email_for_analysis(filepath.stem, load_json_file(filepath))
+    except Exception:
+        return None
+
+
 def prepare_cluster_batch(cluster_id: int) -> str:
     """Prepare a batch from a specific cluster."""
     clusters_data = load_cluster_data()
@@ -205,15 +361,8 @@ def prepare_cluster_batch(cluster_id: int) -> str:
     if not unanalyzed:
         return f"[OK] Cluster {cluster_id} fully analyzed ({len(sample_ids)} emails)"
     
-    # Load and format emails
-    emails = []
-    for email_id in unanalyzed:
-        # Try enriched first
-        enriched_path = ENRICHED_DIR / f"{email_id}.json"
-        if enriched_path.exists():
-            with open(enriched_path) as f:
-                enriched_data = json.load(f)
-            emails.append(format_email_for_analysis(email_id, enriched_data))
+    # Load and format emails (only those with enriched data)
+    emails = [e for e in _map_threaded(_load_enriched_email, unanalyzed) if e is not None]
     
     if not emails:
         return f"[WARNING] No loadable emails in cluster {cluster_id}"
@@ -350,14 +499,7 @@ def prepare_legacy_batch(count: int = 30) -> str:
     batch_files = unanalyzed[:count]
     
     # Load and format
-    emails = []
-    for filepath in batch_files:
-        try:
-            with open(filepath) as f:
-                data = json.load(f)
-            emails.append(format_email_for_analysis(filepath.stem, data))
-        except:
-            continue
+    emails = [e for e in _map_threaded(_load_sample_email, batch_files) if e is not None]
     
     if not emails:
         return "[ERROR] No loadable emails found"
@@ -415,7 +557,7 @@ def show_clusters_status():
             continue
 
         sample_ids = cluster.get('sample_ids', [])
-        analyzed_count = sum(1 for s in sample_ids if s in analyzed)
+        analyzed_count = len(analyzed.intersection(sample_ids))
         unanalyzed = len(sample_ids) - analyzed_count
         coverage = analyzed_count / len(sample_ids) if sample_ids else 0
 
@@ -493,7 +635,7 @@ def check_incomplete_clusters(target_cluster: int, analyzed: set) -> List[tuple]
             break
 
         sample_ids = cluster.get('sample_ids', [])
-        analyzed_count = sum(1 for s in sample_ids if s in analyzed)
+        analyzed_count = len(analyzed.intersection(sample_ids))
 
         # Only flag if cluster was started but is incomplete
         if analyzed_count > 0:
@@ -541,7 +683,7 @@ def show_coverage_calculation(target_coverage: float = 0.8):
         sample_ids = cluster.get('sample_ids', [])
         size = len(sample_ids)
         required = int(size * target_coverage + 0.999)  # ceil
-        analyzed_count = sum(1 for s in sample_ids if s in analyzed)
+        analyzed_count = len(analyzed.intersection(sample_ids))
         coverage = analyzed_count / size if size else 0
 
         total_required += required
@@ -18,13 +18,22 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import io
+import os
 import json
 import argparse
 from pathlib import Path
 from datetime import datetime
+from typing import TextIO, Union
 
 from config import get_data_dir, get_path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Paths
 DATA_DIR = get_data_dir()
 FILTERED_DIR = get_path("filtered_samples")
@@ -36,17 +45,31 @@ SCRIPT_DIR = Path(__file__).parent
 GUIDE_FILE = SCRIPT_DIR.parent / "references" / "llm_analysis_guide.md"
 
 
+def load_json_file(path: Union[str, Path]):
+    """Parse a JSON file, using orjson when available."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def load_posts() -> list:
     """Load filtered LinkedIn posts, sorted by date (oldest first)."""
     posts = []
     if not FILTERED_DIR.exists():
         return posts
 
-    for f in sorted(FILTERED_DIR.glob('linkedin_*.json')):
+    # Plain path strings from one scandir pass; no Path objects needed
+    with os.scandir(FILTERED_DIR) as entries:
+        files = sorted(
+            entry.path for entry in entries
+            if entry.name.startswith('linkedin_') and entry.name.endswith('.json')
+        )
+
+    for f in files:
         try:
-            with open(f) as file:
-                post = json.load(file)
-                posts.append(post)
+            posts.append(load_json_file(f))
         except Exception as e:
             print(f"Warning: Could not load {f}: {e}")
 
@@ -60,8 +83,7 @@ def load_persona() -> dict:
     if not PERSONA_FILE.exists():
         return {}
 
-    with open(PERSONA_FILE) as f:
-        return json.load(f)
+    return load_json_file(PERSONA_FILE)
 
 
 def load_guide() -> str:
@@ -69,8 +91,8 @@ def load_guide() -> str:
     if not GUIDE_FILE.exists():
         return "# Analysis Guide\n\nSee references/llm_analysis_guide.md for instructions."
 
-    with open(GUIDE_FILE) as f:
-        return f.read()
+    # Explicit UTF-8 for Windows compatibility (the guide is not pure ASCII)
+    return GUIDE_FILE.read_text(encoding='utf-8')
 
 
 def format_post(post: dict, index: int, total: int) -> str:
@@ -135,61 +157,77 @@ def format_post(post: dict, index: int, total: int) -> str:
     return "\n".join(lines)
 
 
-def generate_output(posts: list, persona: dict, guide: str) -> str:
-    """Generate the full markdown output."""
-    lines = []
+def write_output(fh: TextIO, posts: list, persona: dict, guide: str) -> int:
+    """
+    Write the full markdown output to fh.
 
-    # Title
-    lines.append("# LinkedIn Voice Analysis Input")
-    lines.append("")
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    lines.append(f"Posts: {len(posts)}")
-    lines.append("")
+    Each post is written as soon as it is formatted, so the whole document
+    is never held in memory at once.
 
-    # Instructions section
-    lines.append("---")
-    lines.append("")
-    lines.append(guide)
-    lines.append("")
+    Returns:
+        Number of characters written
+    """
+    written = 0
+
+    # Title and instructions section
+    written += fh.write(f"""# LinkedIn Voice Analysis Input
+
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+Posts: {len(posts)}
+
+---
+
+{guide}
+
+""")
 
     # Current persona section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Current Persona (Auto-Extracted)")
-    lines.append("")
-    lines.append("The following has already been extracted automatically. Your task is to complete the empty/placeholder fields.")
-    lines.append("")
-    lines.append("```json")
-    lines.append(json.dumps(persona, indent=2))
-    lines.append("```")
-    lines.append("")
+    written += fh.write(f"""---
+
+## Current Persona (Auto-Extracted)
+
+The following has already been extracted automatically. Your task is to complete the empty/placeholder fields.
+
+```json
+{json.dumps(persona, indent=2)}
+```
+
+""")
 
     # Posts section
-    lines.append("---")
-    lines.append("")
-    lines.append("## All Posts (Chronological)")
-    lines.append("")
-    lines.append("Review all posts below to understand the user's voice patterns.")
-    lines.append("")
+    written += fh.write("""---
+
+## All Posts (Chronological)
+
+Review all posts below to understand the user's voice patterns.
+
+""")
 
     for i, post in enumerate(posts):
-        lines.append(format_post(post, i, len(posts)))
+        written += fh.write(format_post(post, i, len(posts)) + "\n")
 
     # Footer with reminder
-    lines.append("---")
-    lines.append("")
-    lines.append("## Your Task")
-    lines.append("")
-    lines.append("Now that you've reviewed all posts, provide your analysis as a JSON object.")
-    lines.append("See the 'Output Format' section in the instructions above for the exact structure.")
-    lines.append("")
-    lines.append("Remember:")
-    lines.append("- Use `index` values (0, 1, 2...) when annotating positive examples")
-    lines.append("- Generate 3-5 negative examples that represent anti-patterns")
-    lines.append("- Be specific in your observations - generic advice isn't helpful")
-    lines.append("")
+    written += fh.write("""---
 
-    return "\n".join(lines)
+## Your Task
+
+Now that you've reviewed all posts, provide your analysis as a JSON object.
+See the 'Output Format' section in the instructions above for the exact structure.
+
+Remember:
+- Use `index` values (0, 1, 2...) when annotating positive examples
+- Generate 3-5 negative examples that represent anti-patterns
+- Be specific in your observations - generic advice isn't helpful
+""")
+
+    return written
+
+
+def generate_output(posts: list, persona: dict, guide: str) -> str:
+    """Generate the full markdown output as a string."""
+    buffer = io.StringIO()
+    write_output(buffer, posts, persona, guide)
+    return buffer.getvalue()
 
 
 def main():
@@ -222,17 +260,14 @@ def main():
     print("Loading analysis guide...")
     guide = load_guide()
 
-    # Generate output
+    # Generate output straight into the file
     print("Generating analysis input file...")
-    output = generate_output(posts, persona, guide)
-
-    # Write output
-    with open(output_path, 'w') as f:
-        f.write(output)
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        size = write_output(f, posts, persona, guide)
 
     print(f"\n[OK] Generated: {output_path}")
     print(f"   Posts included: {len(posts)}")
-    print(f"   File size: {len(output):,} characters")
+    print(f"   File size: {size:,} characters")
     print("")
     print("Next steps:")
     print("1. Open the generated file")
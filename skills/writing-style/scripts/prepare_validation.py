@@ -21,6 +21,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import os
 import json
 import re
 import argparse
@@ -30,9 +31,52 @@ from typing import Dict, List, Tuple, Optional
 
 from config import get_data_dir, get_path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 VALIDATION_DIR = get_path("validation_set")
 OUTPUT_FILE = get_path("validation_pairs.json")
 
+# Pattern for "On DATE, NAME wrote:" or similar
+_WROTE_RE = re.compile(r'^On .+wrote:?\s*$', re.IGNORECASE)
+
+_GREETING_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'^(Hi|Hey|Hello|Dear|Good morning|Good afternoon|Good evening)\b',
+    r'^(Thanks|Thank you)\b',
+)]
+
+_CLOSING_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'^(Best|Thanks|Thank you|Cheers|Regards|Sincerely|Best regards|Kind regards|Warm regards)',
+    r'^(Talk soon|Looking forward|Let me know|Hope this helps)',
+    r'^[-–—]?\s*[A-Z][a-z]+$',  # Just a name like "John" or "- John"
+)]
+
+_CONTRACTION_RE = re.compile(
+    r"\b(i'm|i've|i'll|i'd|we're|we've|we'll|we'd|you're|you've|you'll|you'd|"
+    r"they're|they've|they'll|they'd|he's|she's|it's|that's|there's|here's|"
+    r"what's|who's|can't|won't|don't|doesn't|didn't|isn't|aren't|wasn't|"
+    r"weren't|haven't|hasn't|hadn't|couldn't|wouldn't|shouldn't)\b",
+    re.IGNORECASE
+)
+
+
+def load_json_file(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    data = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def list_validation_files() -> List[Path]:
+    """Validation email files, sorted by name (one scandir pass)."""
+    with os.scandir(VALIDATION_DIR) as entries:
+        names = sorted(entry.name for entry in entries if entry.name.endswith('.json'))
+    return [VALIDATION_DIR / name for name in names]
+
 
 def extract_quoted_and_reply(body: str) -> Tuple[str, str]:
     """
@@ -49,38 +93,37 @@ def extract_quoted_and_reply(body: str) -> Tuple[str, str]:
     if not body:
         return "", ""
 
-    lines = body.split('\n')
     reply_lines = []
     quoted_lines = []
     in_quote_block = False
+    # An empty line inside a quote block continues the quote only if the
+    # next line is quoted too, so it is held until that line is seen
+    pending_blank = None
 
-    # Pattern for "On DATE, NAME wrote:" or similar
-    wrote_pattern = re.compile(r'^On .+wrote:?\s*$', re.IGNORECASE)
-
-    for i, line in enumerate(lines):
+    for line in body.split('\n'):
         stripped = line.strip()
+        is_quoted = stripped.startswith(('>', '|'))
+
+        if pending_blank is not None:
+            if is_quoted:
+                quoted_lines.append('')
+            else:
+                in_quote_block = False
+                reply_lines.append(pending_blank)
+            pending_blank = None
 
         # Check for quote markers
-        if stripped.startswith('>') or stripped.startswith('|'):
+        if is_quoted:
             # This is quoted text
             quoted_lines.append(stripped.lstrip('>|').strip())
             in_quote_block = True
-        elif wrote_pattern.match(stripped):
+        elif _WROTE_RE.match(stripped):
             # "On ... wrote:" line - marks start of quote
             in_quote_block = True
             # Don't include the "On ... wrote:" line itself
-        elif in_quote_block and stripped == '':
+        elif in_quote_block and not stripped:
             # Empty line might end quote block or continue it
-            # Look ahead to see if more quotes follow
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if next_line.startswith('>') or next_line.startswith('|'):
-                    quoted_lines.append('')
-                else:
-                    in_quote_block = False
-                    reply_lines.append(line)
-            else:
-                in_quote_block = False
+            pending_blank = line
         elif in_quote_block:
             # Continuation of quoted block without marker
             quoted_lines.append(stripped)
@@ -88,6 +131,8 @@ def extract_quoted_and_reply(body: str) -> Tuple[str, str]:
             # This is the user's reply
             reply_lines.append(line)
 
+    # An empty last line of a quote block belongs to neither side
+
     quoted_text = '\n'.join(quoted_lines).strip()
     reply_text = '\n'.join(reply_lines).strip()
 
@@ -107,25 +152,16 @@ def extract_greeting_and_closing(reply_text: str) -> Dict[str, str]:
     if lines:
         # Check first line for greeting patterns
         first_line = lines[0]
-        greeting_patterns = [
-            r'^(Hi|Hey|Hello|Dear|Good morning|Good afternoon|Good evening)\b',
-            r'^(Thanks|Thank you)\b',
-        ]
-        for pattern in greeting_patterns:
-            if re.match(pattern, first_line, re.IGNORECASE):
+        for pattern in _GREETING_RES:
+            if pattern.match(first_line):
                 greeting = first_line
                 break
 
     if len(lines) > 1:
         # Check last few lines for closing patterns
-        closing_patterns = [
-            r'^(Best|Thanks|Thank you|Cheers|Regards|Sincerely|Best regards|Kind regards|Warm regards)',
-            r'^(Talk soon|Looking forward|Let me know|Hope this helps)',
-            r'^[-–—]?\s*[A-Z][a-z]+$',  # Just a name like "John" or "- John"
-        ]
         for line in reversed(lines[-3:]):
-            for pattern in closing_patterns:
-                if re.match(pattern, line, re.IGNORECASE):
+            for pattern in _CLOSING_RES:
+                if pattern.match(line):
                     closing = line
                     break
             if closing:
@@ -163,13 +199,7 @@ def analyze_tone_hints(reply_text: str) -> List[str]:
 
     # Contractions - normalize Unicode apostrophes and use comprehensive pattern
     normalized_text = reply_text.replace('\u2019', "'").replace('\u2018', "'")
-    contraction_pattern = (
-        r"\b(i'm|i've|i'll|i'd|we're|we've|we'll|we'd|you're|you've|you'll|you'd|"
-        r"they're|they've|they'll|they'd|he's|she's|it's|that's|there's|here's|"
-        r"what's|who's|can't|won't|don't|doesn't|didn't|isn't|aren't|wasn't|"
-        r"weren't|haven't|hasn't|hadn't|couldn't|wouldn't|shouldn't)\b"
-    )
-    if re.search(contraction_pattern, normalized_text, re.IGNORECASE):
+    if _CONTRACTION_RE.search(normalized_text):
         hints.append('uses_contractions')
 
     return hints
@@ -178,8 +208,7 @@ def analyze_tone_hints(reply_text: str) -> List[str]:
 def process_validation_email(email_file: Path) -> Optional[Dict]:
     """Process a single validation email into a context/reply pair."""
     try:
-        with open(email_file) as f:
-            email_data = json.load(f)
+        email_data = load_json_file(email_file)
     except (json.JSONDecodeError, IOError) as e:
         print(f"  Warning: Could not read {email_file.name}: {e}")
         return None
@@ -244,7 +273,7 @@ def prepare_validation(dry_run: bool = False) -> bool:
         print("  python fetch_emails.py --holdout 0.15")
         return False
 
-    email_files = list(VALIDATION_DIR.glob("*.json"))
+    email_files = list_validation_files()
 
     if not email_files:
         print("No validation emails found.")
@@ -257,7 +286,7 @@ def prepare_validation(dry_run: bool = False) -> bool:
     pairs = []
     skipped = 0
 
-    for email_file in sorted(email_files):
+    for email_file in email_files:
         pair = process_validation_email(email_file)
         if pair:
             pairs.append(pair)
@@ -321,12 +350,11 @@ def show_status():
         print("  python fetch_emails.py --holdout 0.15")
         return
 
-    email_files = list(VALIDATION_DIR.glob("*.json"))
+    email_files = list_validation_files()
     print(f"\nValidation emails: {len(email_files)}")
 
     if OUTPUT_FILE.exists():
-        with open(OUTPUT_FILE) as f:
-            data = json.load(f)
+        data = load_json_file(OUTPUT_FILE)
         print(f"Validation pairs:  {data.get('valid_pairs', 0)}")
         print(f"Created:           {data.get('created', 'Unknown')}")
 
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Unit Tests - Skill Generator
+
+Tests for generate_skill.py - sample indexing and markdown generation.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add skill scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "writing-style" / "scripts"))
+
+import generate_skill
+
+
+def _write_sample(samples_dir: Path, sample_id: str, persona: str, body: str = "Hello there"):
+    """Write a sample file in the format produced by ingest.py."""
+    sample = {
+        "id": sample_id,
+        "persona": persona,
+        "content": {"subject": f"Subject {sample_id}", "body": body, "to": "someone@example.com"},
+        "analysis": {"tone_vectors": {"formality": 5}}
+    }
+    (samples_dir / f"{sample_id}.json").write_text(json.dumps(sample))
+
+
+class TestJsonHelpers(unittest.TestCase):
+    """Test the orjson/json helpers."""
+
+    def test_helpers_match_stdlib_without_orjson(self):
+        """The stdlib fallback should parse and indent like json."""
+        data = {"name": "Exec", "levels": [1, 2], "nested": {"ok": True}}
+        with patch.object(generate_skill, 'ORJSON_AVAILABLE', False):
+            self.assertEqual(generate_skill._loads(b'{"a": [1, 2]}'), {"a": [1, 2]})
+            self.assertEqual(generate_skill._dumps(data), json.dumps(data, indent=2))
+
+    def test_backends_produce_identical_output(self):
+        """orjson and the stdlib fallback should render the same JSON block."""
+        data = {"name": "Caf\u00e9", "levels": [1, 2], "nested": {"ok": None, "x": 1.5}}
+        with patch.object(generate_skill, 'ORJSON_AVAILABLE', False):
+            fallback = generate_skill._dumps(data)
+        if generate_skill.ORJSON_AVAILABLE:
+            self.assertEqual(generate_skill._dumps(data), fallback)
+        self.assertIn("Caf\u00e9", fallback)
+
+    def test_dumps_round_trips(self):
+        """Whichever backend is active, output should parse back to the input."""
+        data = {"name": "Caf\u00e9", "levels": [1, 2], "nested": {"ok": None}}
+        self.assertEqual(json.loads(generate_skill._dumps(data)), data)
+
+
+class TestJsonCache(unittest.TestCase):
+    """Test the mtime-keyed JSON file cache."""
+
+    def test_reuses_parse_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            registry_file = Path(tmp_dir) / "persona_registry.json"
+            registry_file.write_text(json.dumps({"personas": {"A": {}}}))
+
+            first, _ = generate_skill._read_json(registry_file)
+            again, _ = generate_skill._read_json(registry_file)
+            self.assertIs(first, again)
+
+            registry_file.write_text(json.dumps({"personas": {"A": {}, "B": {}}}))
+            updated, raw_bytes = generate_skill._read_json(registry_file)
+            self.assertEqual(set(updated["personas"]), {"A", "B"})
+            self.assertEqual(raw_bytes, registry_file.read_bytes())
+
+
+class TestCheckValidationComplete(unittest.TestCase):
+    """Test the validation gate."""
+
+    def test_missing_and_corrupt_files_count_as_incomplete(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            feedback_file = tmp_path / "validation_feedback.json"
+            feedback_file.write_text("{not json")
+
+            with patch.object(generate_skill, 'VALIDATION_REPORT_FILE', tmp_path / "missing.json"), \
+                 patch.object(generate_skill, 'VALIDATION_FEEDBACK_FILE', feedback_file):
+                result = generate_skill.check_validation_complete()
+
+        self.assertFalse(result["phase1_complete"])
+        self.assertFalse(result["phase2_complete"])
+        self.assertEqual(result["feedback_count"], 0)
+
+    def test_both_phases_complete(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            report_file = tmp_path / "validation_report.json"
+            report_file.write_text(json.dumps({"summary": {"overall_score": 82}}))
+            feedback_file = tmp_path / "validation_feedback.json"
+            feedback_file.write_text(json.dumps({"feedback": [{}, {}], "interactive_complete": True}))
+
+            with patch.object(generate_skill, 'VALIDATION_REPORT_FILE', report_file), \
+                 patch.object(generate_skill, 'VALIDATION_FEEDBACK_FILE', feedback_file):
+                result = generate_skill.check_validation_complete()
+
+        self.assertEqual(result, {
+            "phase1_complete": True, "phase2_complete": True, "score": 82, "feedback_count": 2
+        })
+
+
+class TestNameValidation(unittest.TestCase):
+    """Test skill name validation."""
+
+    def test_valid_names(self):
+        for name in ["john", "John_Doe", "jane-doe", "j2", "-x_"]:
+            self.assertTrue(generate_skill._NAME_RE.match(name), name)
+
+    def test_invalid_names(self):
+        for name in ["", "---", "_", "john doe", "john/../x", "john\n", "jöhn"]:
+            self.assertFalse(generate_skill._NAME_RE.match(name), repr(name))
+
+
+class TestSummarizeCharacteristics(unittest.TestCase):
+    """Test the per-persona characteristics summary."""
+
+    def test_full_characteristics(self):
+        view = generate_skill._summarize_characteristics({
+            "formality": 7, "warmth": 4, "authority": 8, "directness": 9,
+            "typical_greeting": "Hi team", "typical_closing": "Thanks",
+            "uses_contractions": True, "tone": ["direct", "crisp"]
+        })
+
+        self.assertEqual(view.tone_str, "Form: 7, Warm: 4, Auth: 8, Dire: 9")
+        self.assertEqual(view.rows[0], ("Formality", "7"))
+        self.assertEqual(view.greeting, "Hi team")
+        self.assertEqual(view.contractions, "True")
+        self.assertEqual(view.descriptors, "direct, crisp")
+
+    def test_missing_characteristics(self):
+        view = generate_skill._summarize_characteristics({"warmth": 9})
+
+        self.assertEqual(view.tone_str, "Warm: 9")
+        self.assertEqual(dict(view.rows)["Formality"], "N/A")
+        self.assertEqual(view.closing, "N/A")
+        self.assertEqual(view.descriptors, "")
+
+    def test_empty_characteristics(self):
+        self.assertEqual(generate_skill._summarize_characteristics({}).tone_str, "See details")
+
+
+class TestSampleIndex(unittest.TestCase):
+    """Test the persona -> sample file index."""
+
+    def test_index_groups_samples_by_persona(self):
+        """Each persona should map to its own sample files."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            samples_dir = Path(tmp_dir)
+            _write_sample(samples_dir, "email_001", "Executive Brief")
+            _write_sample(samples_dir, "email_002", "Executive Brief")
+            _write_sample(samples_dir, "email_003", "Team Update")
+
+            with patch.object(generate_skill, 'SAMPLES_DIR', samples_dir):
+                index = generate_skill.build_sample_index()
+
+            self.assertEqual(len(index["Executive Brief"]), 2)
+            self.assertEqual([p.name for p in index["Team Update"]], ["email_003.json"])
+
+    def test_index_skips_unreadable_files(self):
+        """Corrupt sample files should be ignored rather than raising."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            samples_dir = Path(tmp_dir)
+            _write_sample(samples_dir, "email_001", "Executive Brief")
+            (samples_dir / "broken.json").write_text("{not json")
+
+            with patch.object(generate_skill, 'SAMPLES_DIR', samples_dir):
+                index = generate_skill.build_sample_index()
+
+            self.assertEqual(list(index), ["Executive Brief"])
+
+    def test_index_skips_samples_without_body(self):
+        """Samples with no body or snippet can't serve as examples."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            samples_dir = Path(tmp_dir)
+            _write_sample(samples_dir, "email_001", "Executive Brief")
+            _write_sample(samples_dir, "email_002", "Executive Brief", body="")
+
+            with patch.object(generate_skill, 'SAMPLES_DIR', samples_dir):
+                index = generate_skill.build_sample_index()
+
+            self.assertEqual([p.name for p in index["Executive Brief"]], ["email_001.json"])
+
+    def test_index_refreshes_when_samples_added(self):
+        """Adding a sample changes the directory mtime and invalidates the cached index."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            samples_dir = Path(tmp_dir)
+            _write_sample(samples_dir, "email_001", "Executive Brief")
+
+            with patch.object(generate_skill, 'SAMPLES_DIR', samples_dir):
+                self.assertIs(generate_skill.build_sample_index(), generate_skill.build_sample_index())
+                _write_sample(samples_dir, "email_002", "Team Update")
+                os.utime(samples_dir, ns=(0, samples_dir.stat().st_mtime_ns + 1))
+                index = generate_skill.build_sample_index()
+
+            self.assertIn("Team Update", index)
+
+    def test_index_empty_when_samples_dir_missing(self):
+        """A missing samples directory should produce an empty index."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.object(generate_skill, 'SAMPLES_DIR', Path(tmp_dir) / "missing"):
+                self.assertEqual(generate_skill.build_sample_index(), {})
+
+
+class TestLoadSampleEmails(unittest.TestCase):
+    """Test few-shot sample loading."""
+
+    def test_load_respects_persona_and_limit(self):
+        """Only the requested persona's samples are returned, up to the limit."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            samples_dir = Path(tmp_dir)
+            for i in range(4):
+                _write_sample(samples_dir, f"email_00{i}", "Executive Brief")
+            _write_sample(samples_dir, "email_010", "Team Update", body="Team body")
+
+            with patch.object(generate_skill, 'SAMPLES_DIR', samples_dir):
+                samples = generate_skill.load_sample_emails("Executive Brief", limit=2)
+                team = generate_skill.load_sample_emails("Team Update")
+
+            self.assertEqual(len(samples), 2)
+            self.assertEqual([s['body'] for s in team], ["Team body"])
+
+    def test_load_persona_samples_covers_every_persona(self):
+        """One call should return examples for every persona with samples."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            samples_dir = Path(tmp_dir)
+            for i in range(3):
+                _write_sample(samples_dir, f"email_00{i}", "Executive Brief")
+            _write_sample(samples_dir, "email_010", "Team Update")
+
+            with patch.object(generate_skill, 'SAMPLES_DIR', samples_dir):
+                persona_samples = generate_skill.load_persona_samples(limit=2)
+
+            self.assertEqual(set(persona_samples), {"Executive Brief", "Team Update"})
+            self.assertEqual(len(persona_samples["Executive Brief"]), 2)
+
+
+class TestEmailPersonasMd(unittest.TestCase):
+    """Test the email personas reference file."""
+
+    def test_v2_example_bodies_truncated_without_mutating_persona(self):
+        """Long example bodies are truncated in the output only."""
+        long_body = "z" * 600
+        persona = {
+            "name": "V2 Persona",
+            "voice_fingerprint": {"formality": {"level": 6, "instruction": "Be formal"}},
+            "example_bank": {"examples": [{"body": long_body}, {"body": "short"}]}
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.object(generate_skill, 'SAMPLES_DIR', Path(tmp_dir)):
+                content = generate_skill.generate_email_personas_md([persona])
+
+        self.assertIn("z" * 500 + "...[truncated]", content)
+        self.assertNotIn("z" * 501, content)
+        self.assertEqual(persona["example_bank"]["examples"][0]["body"], long_body)
+
+    def test_uses_provided_persona_samples(self):
+        """Pre-loaded samples are rendered without touching SAMPLES_DIR."""
+        persona = {"name": "Executive Brief", "characteristics": {"formality": 8}}
+        samples = {"Executive Brief": [{"subject": "Q3 update", "body": "Numbers are in."}]}
+
+        with patch.object(generate_skill, 'build_sample_index', side_effect=AssertionError):
+            content = generate_skill.generate_email_personas_md([persona], persona_samples=samples)
+
+        self.assertIn("- Subject: Q3 update", content)
+        self.assertIn("Numbers are in.", content)
+
+
+class TestLinkedInVoiceMd(unittest.TestCase):
+    """Test the LinkedIn voice reference file."""
+
+    def test_raw_bytes_embedded_when_no_examples(self):
+        """The persona file is embedded verbatim when nothing needs stripping."""
+        linkedin = {"confidence": 0.9, "voice": {"signature_phrases": ["caf\u00e9"]}}
+        raw_bytes = json.dumps(linkedin, indent=2).encode('utf-8')
+
+        content = generate_skill.generate_linkedin_voice_md(linkedin, raw_bytes)
+
+        self.assertIn(raw_bytes.decode('utf-8'), content)
+
+    def test_few_shot_examples_stripped_from_profile(self):
+        """Few-shot examples are rendered as posts, not inside the JSON block."""
+        linkedin = {
+            "confidence": 0.9,
+            "few_shot_examples": [{"input_context": "Launch", "output_text": "We launched!"}]
+        }
+        raw_bytes = json.dumps(linkedin, indent=2).encode('utf-8')
+
+        content = generate_skill.generate_linkedin_voice_md(linkedin, raw_bytes)
+        profile_block = content.split("```json\n", 1)[1].split("\n```", 1)[0]
+
+        self.assertNotIn("few_shot_examples", profile_block)
+        self.assertIn("### Example 1: Launch", content)
+
+
+class TestGenerateSkill(unittest.TestCase):
+    """Test the full skill package generation."""
+
+    def test_returns_manifest_of_written_files(self):
+        """generate_skill should report exactly the files it wrote."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            registry_file = tmp_path / "persona_registry.json"
+            registry_file.write_text(json.dumps({
+                "personas": {"Executive Brief": {"description": "Execs", "characteristics": {"formality": 8}}}
+            }))
+            samples_dir = tmp_path / "samples"
+            samples_dir.mkdir()
+            _write_sample(samples_dir, "email_001", "Executive Brief")
+
+            with patch.object(generate_skill, 'PERSONA_REGISTRY_FILE', registry_file), \
+                 patch.object(generate_skill, 'LINKEDIN_PERSONA_FILE', tmp_path / "missing.json"), \
+                 patch.object(generate_skill, 'SAMPLES_DIR', samples_dir):
+                skill_dir, written_files = generate_skill.generate_skill("john", tmp_path / "out")
+
+            self.assertEqual(skill_dir, tmp_path / "out" / "john-writing-clone")
+            self.assertEqual(
+                sorted(str(f.relative_to(skill_dir)) for f in written_files),
+                sorted(str(f.relative_to(skill_dir)) for f in skill_dir.rglob("*") if f.is_file())
+            )
+            self.assertEqual(len(written_files), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
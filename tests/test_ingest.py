@@ -362,6 +362,303 @@ class TestIngestBatchWithValidation(unittest.TestCase):
             self.assertEqual(len(validation_called), 1)
 
 
+class TestLoadJson(unittest.TestCase):
+    """Test load_json defaults."""
+
+    def test_missing_file_returns_default(self):
+        """Missing files should yield the supplied default, else {}."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            missing = Path(tmp_dir) / "missing.json"
+            self.assertEqual(ingest.load_json(missing), {})
+            self.assertEqual(ingest.load_json(missing, default={"personas": {}}),
+                             {"personas": {}})
+
+
+class TestSaveJson(unittest.TestCase):
+    """Test JSON serialization of saved files."""
+
+    def test_output_matches_stdlib_indent(self):
+        """Saved files should match json.dumps(indent=2) formatting."""
+        import ingest
+
+        data = {"a": [1, 2.5, {}], "b": "x", "c": [], "d": None, "e": {"f": True}}
+        self.assertEqual(ingest._dumps(data), json.dumps(data, indent=2))
+
+    def test_non_ascii_serialized_once(self):
+        """Non-ASCII data (in values or keys) goes straight to json.dumps."""
+        import ingest
+
+        if not ingest.ORJSON_AVAILABLE:
+            self.skipTest("orjson not installed")
+        for data in ({"a": [{"b": "caf\u00e9"}]}, {"caf\u00e9": 1}):
+            with self.subTest(data=data), \
+                 patch.object(ingest.orjson, 'dumps', wraps=ingest.orjson.dumps) as dumps:
+                self.assertEqual(ingest._dumps(data), json.dumps(data, indent=2))
+            dumps.assert_not_called()
+
+    def test_non_ascii_is_escaped(self):
+        """Non-ASCII text should stay escaped so files remain ASCII-only."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "out" / "data.json"
+            ingest.save_json(path, {"body": "caf\u00e9 \u2014 ok"})
+
+            raw = path.read_bytes()
+            self.assertTrue(raw.isascii())
+            self.assertEqual(json.loads(raw)["body"], "caf\u00e9 \u2014 ok")
+
+
+    def test_unchanged_content_is_not_rewritten(self):
+        """Saving identical data should not touch the existing file."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "state.json"
+            ingest.save_json(path, {"v": 1})
+
+            with patch.object(ingest.os, 'replace') as mock_replace:
+                ingest.save_json(path, {"v": 1})
+                mock_replace.assert_not_called()
+
+                ingest.save_json(path, {"v": 2})
+                mock_replace.assert_called_once()
+
+    def test_failed_write_keeps_original(self):
+        """A failed save should leave the previous file intact and no temp file."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "state.json"
+            ingest.save_json(path, {"v": 1})
+
+            with patch.object(ingest, '_dumps', side_effect=TypeError("boom")):
+                with self.assertRaises(TypeError):
+                    ingest.save_json(path, {"v": 2})
+
+            self.assertEqual(json.loads(path.read_text()), {"v": 1})
+            self.assertEqual([p.name for p in Path(tmp_dir).iterdir()], ["state.json"])
+
+
+class TestListSampleIds(unittest.TestCase):
+    """Test sample id enumeration."""
+
+    def test_lists_json_stems_only(self):
+        """Should return ids of .json files and ignore other entries."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            samples_dir = Path(tmp_dir) / "samples"
+            samples_dir.mkdir()
+            (samples_dir / "a.json").write_text("{}")
+            (samples_dir / "b.json").write_text("{}")
+            (samples_dir / "notes.txt").write_text("")
+
+            with patch.object(ingest, 'SAMPLES_DIR', samples_dir):
+                self.assertEqual(ingest._list_sample_ids(), {"a", "b"})
+
+    def test_missing_dir_returns_empty_set(self):
+        """Should return an empty set when SAMPLES_DIR does not exist."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.object(ingest, 'SAMPLES_DIR', Path(tmp_dir) / "nope"):
+                self.assertEqual(ingest._list_sample_ids(), set())
+
+
+class TestValidateBatchCoverage(unittest.TestCase):
+    """Test coverage validation against clusters.json."""
+
+    def test_matches_ids_with_or_without_email_prefix(self):
+        """Batch ids should match cluster ids regardless of the email_ prefix."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            clusters_file = Path(tmp_dir) / "clusters.json"
+            clusters_file.write_text(json.dumps({
+                "clusters": [{"id": 1, "sample_ids": ["a", "email_b"]}]
+            }))
+            batch = {"cluster_id": 1, "samples": [{"id": "email_a"}, {"id": "b"}]}
+
+            with patch.object(ingest, 'CLUSTERS_FILE', clusters_file):
+                ok, message = ingest.validate_batch_coverage(batch, analyzed_ids=set())
+
+            self.assertTrue(ok)
+            self.assertEqual(message, "")
+
+    def test_uses_supplied_analyzed_ids(self):
+        """Supplied analyzed_ids should count toward coverage without a rescan."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            clusters_file = tmp_path / "clusters.json"
+            clusters_file.write_text(json.dumps({
+                "clusters": [{"id": 1, "sample_ids": ["a", "b", "c", "d", "e"]}]
+            }))
+            batch = {"cluster_id": 1, "samples": [{"id": "e"}]}
+
+            with patch.object(ingest, 'CLUSTERS_FILE', clusters_file), \
+                 patch.object(ingest, '_list_sample_ids') as mock_list:
+                ok, _ = ingest.validate_batch_coverage(
+                    batch, analyzed_ids={"a", "b", "c"})
+                mock_list.assert_not_called()
+                self.assertTrue(ok)
+
+                ok, message = ingest.validate_batch_coverage(
+                    batch, analyzed_ids=set())
+                self.assertFalse(ok)
+                self.assertIn("COVERAGE VALIDATION FAILED", message)
+
+
+class TestLoadClusters(unittest.TestCase):
+    """Test the cached clusters.json loader."""
+
+    def test_indexes_by_id_and_reloads_on_change(self):
+        """Clusters should be indexed by id and re-read when the file changes."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            clusters_file = Path(tmp_dir) / "clusters.json"
+            clusters_file.write_text(json.dumps({"clusters": [{"id": 1, "sample_ids": ["a"]}]}))
+
+            with patch.object(ingest, 'CLUSTERS_FILE', clusters_file):
+                data, by_id = ingest._load_clusters()
+                self.assertEqual(by_id[1]["sample_ids"], ["a"])
+                self.assertIs(ingest._load_clusters()[0], data)
+
+                clusters_file.write_text(json.dumps({"clusters": [{"id": 2, "sample_ids": ["bb"]}]}))
+                _, by_id = ingest._load_clusters()
+                self.assertEqual(list(by_id), [2])
+
+    def test_missing_file(self):
+        """A missing clusters.json should load as empty."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.object(ingest, 'CLUSTERS_FILE', Path(tmp_dir) / "none.json"):
+                self.assertEqual(ingest._load_clusters(), ({}, {}))
+
+
+class TestWriteSamplesBatch(unittest.TestCase):
+    """Test the batched sample writer."""
+
+    def test_writes_all_samples_and_creates_dir(self):
+        """Should create SAMPLES_DIR once and write one file per item."""
+        import ingest
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            samples_dir = Path(tmp_dir) / "samples"
+            items = [
+                (samples_dir / f"s{i}.json", {"id": f"s{i}", "persona": "A"})
+                for i in range(3)
+            ]
+
+            with patch.object(ingest, 'SAMPLES_DIR', samples_dir):
+                ingest.write_samples_batch(items)
+
+            for path, data in items:
+                self.assertEqual(json.loads(path.read_text()), data)
+
+
+class TestSchemaMigration(unittest.TestCase):
+    """Test that migration only runs for v1 batches."""
+
+    def _ingest(self, batch_data):
+        import ingest
+        from io import StringIO
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            samples_dir = tmp_path / "samples"
+            batch_file = tmp_path / "batch.json"
+            batch_file.write_text(json.dumps(batch_data))
+
+            with patch.object(ingest, 'PERSONA_FILE', tmp_path / "persona_registry.json"), \
+                 patch.object(ingest, 'SAMPLES_DIR', samples_dir), \
+                 patch.object(ingest, 'RAW_SAMPLES_DIR', tmp_path / "raw_samples"), \
+                 patch.object(ingest, 'STATE_FILE', tmp_path / "state.json"), \
+                 patch.object(ingest, 'CLUSTERS_FILE', tmp_path / "nonexistent.json"), \
+                 patch('sys.stdout', StringIO()):
+                ingest.ingest_batch(batch_file, dry_run=False, force=True)
+
+            return json.loads((samples_dir / "s1.json").read_text())["analysis"]
+
+    def test_v1_batch_analysis_is_migrated(self):
+        """v1 batches should have sample analysis migrated to v2."""
+        analysis = self._ingest({
+            "new_personas": [{"name": "A", "characteristics": {"formality": 5}}],
+            "samples": [{"id": "s1", "persona": "A", "analysis": {"formality": 5}}]
+        })
+        self.assertIn("voice_fingerprint", analysis)
+
+    def test_v2_batch_analysis_is_left_alone(self):
+        """Batches declaring schema 2.0 should not be migrated."""
+        analysis = self._ingest({
+            "schema_version": "2.0",
+            "new_personas": [{"name": "A"}],
+            "samples": [{"id": "s1", "persona": "A", "analysis": {"notes": "x"}}]
+        })
+        self.assertEqual(analysis, {"notes": "x"})
+
+
+class TestIngestReport(unittest.TestCase):
+    """Test the buffered ingest report."""
+
+    def _run(self, **kwargs):
+        import ingest
+        from io import StringIO
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            batch_file = Path(tmp_dir) / "batch.json"
+            batch_file.write_text(json.dumps({"samples": []}))
+            captured_output = StringIO()
+            with patch('sys.stdout', captured_output):
+                result = ingest.ingest_batch(batch_file, dry_run=True, **kwargs)
+        return result, captured_output.getvalue()
+
+    def test_rejected_batch_reports_error(self):
+        """An empty batch should be rejected with its report written out."""
+        result, output = self._run()
+        self.assertFalse(result)
+        self.assertIn("[ERROR] No 'samples' array", output)
+        self.assertIn("'samples' array exists but is empty", output)
+
+    def test_quiet_suppresses_report(self):
+        """quiet=True should produce no output."""
+        result, output = self._run(quiet=True)
+        self.assertFalse(result)
+        self.assertEqual(output, "")
+
+
+class TestSampleFileLayout(unittest.TestCase):
+    """Test that sample files are laid out the same way in every case."""
+
+    SAMPLE = {
+        "id": "s1", "source": "email", "persona": "A", "confidence": 0.5,
+        "analysis": {"tone": ["warm", "direct"]},
+        "content": {"body": "Hi there"}, "ingested": "2026-01-01T00:00:00",
+    }
+
+    def test_layout_independent_of_orjson_and_text(self):
+        """ASCII or not, with or without orjson, files match json.dumps(indent=2)."""
+        import ingest
+
+        non_ascii = json.loads(json.dumps(self.SAMPLE))
+        non_ascii["content"]["body"] = "Hi \u2014 caf\u00e9"
+        for sample in (self.SAMPLE, non_ascii):
+            for orjson_available in (ingest.ORJSON_AVAILABLE, False):
+                with self.subTest(orjson=orjson_available, body=sample["content"]["body"]), \
+                     patch.object(ingest, 'ORJSON_AVAILABLE', orjson_available), \
+                     tempfile.TemporaryDirectory() as tmp_dir:
+                    path = Path(tmp_dir) / "s1.json"
+                    ingest._write_one(path, sample)
+                    text = path.read_text(encoding="ascii")
+                    self.assertEqual(text, json.dumps(sample, indent=2))
+
+
 class TestExportedFunctions(unittest.TestCase):
     """Test that required functions are exported."""
 
@@ -1,17 +1,21 @@
 #!/usr/bin/env python3
 """Tests for JSON repair utilities."""
 
+import json
 import unittest
 import sys
 from pathlib import Path
-
+from unittest.mock import patch
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "writing-style" / "scripts"))
 
+import json_repair
 from json_repair import (
+    IncrementalJsonRepair,
     extract_json_block,
     repair_trailing_commas,
     repair_truncated_json,
+    repair_unescaped_quotes,
     repair_json,
     safe_parse_json,
     validate_analysis_schema,
@@ -71,6 +75,18 @@ class TestExtractJsonBlock(unittest.TestCase):
         self.assertEqual(result, '{"message": "Use {name} for template"}')
 
 
+    def test_extract_skips_non_json_fence(self):
+        """A non-JSON fenced block should be skipped for a later JSON one."""
+        text = 'Example:\n```\npip install x\n```\nResult:\n```json\n{"a": 1}\n```'
+        result = extract_json_block(text)
+        self.assertEqual(result, '{"a": 1}')
+
+    def test_extract_unclosed_fence(self):
+        """An unclosed opening fence should still yield the JSON body."""
+        text = '```json\n{"a": [1, 2]}'
+        result = extract_json_block(text)
+        self.assertEqual(result, '{"a": [1, 2]}')
+
 class TestRepairTrailingCommas(unittest.TestCase):
     """Tests for trailing comma repair."""
 
@@ -145,6 +161,37 @@ class TestRepairTruncatedJson(unittest.TestCase):
         self.assertEqual(result, '{"key": "value"}')
 
 
+class TestRepairUnescapedQuotes(unittest.TestCase):
+    """Tests for unescaped quote repair."""
+
+    def test_escapes_inner_quote(self):
+        """A quote inside a string that isn't followed by structure gets escaped."""
+        text = '{"quote": "He said "hi" today"}'
+        result = repair_unescaped_quotes(text)
+        self.assertEqual(json.loads(result), {"quote": 'He said "hi" today'})
+
+    def test_valid_json_unchanged(self):
+        """Valid JSON, including existing escapes, should pass through unchanged."""
+        text = '{"a": "x \\"y\\" z", "b": ["c", "d"]}'
+        self.assertEqual(repair_unescaped_quotes(text), text)
+
+
+class TestRepairJson(unittest.TestCase):
+    """Tests for the combined repair pass."""
+
+    def test_extract_commas_and_truncation(self):
+        """Fenced, truncated JSON with trailing commas should be fully repaired."""
+        text = 'Here you go:\n```json\n{"a": [1, 2,], "b": {"c": "d",}, "e": [3'
+        result = repair_json(text)
+        self.assertEqual(json.loads(result), {"a": [1, 2], "b": {"c": "d"}, "e": [3]})
+
+    def test_commas_inside_strings_preserved(self):
+        """Trailing-comma removal should not alter string contents."""
+        text = 'Result: {"note": "a,}b", "list": ["x, ]",],} done'
+        result = repair_json(text)
+        self.assertEqual(json.loads(result), {"note": "a,}b", "list": ["x, ]"]})
+
+
 class TestSafeParseJson(unittest.TestCase):
     """Tests for safe JSON parsing."""
 
@@ -178,6 +225,40 @@ class TestSafeParseJson(unittest.TestCase):
         self.assertTrue(result['success'])
         self.assertTrue(result['repair_applied'])
 
+    def test_parse_truncated_with_trailing_comma(self):
+        """Trailing comma and truncation repairs combine."""
+        text = '{"a": [1, 2,], "b": "unfinished'
+        result = safe_parse_json(text)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['data'], {"a": [1, 2], "b": "unfinished"})
+
+    def test_parse_bytes(self):
+        """UTF-8 bytes (with or without BOM) are decoded once and parsed."""
+        for raw in ['```json\n{"t": "caf\u00e9",}\n```'.encode('utf-8'),
+                    b'\xef\xbb\xbf{"t": "caf\xc3\xa9"}']:
+            with self.subTest(raw=raw):
+                result = safe_parse_json(raw)
+                self.assertTrue(result['success'])
+                self.assertEqual(result['data'], {"t": "caf\u00e9"})
+
+    def test_unchanged_repairs_not_reparsed(self):
+        """Repairs that leave the text unchanged are not parsed again."""
+        text = '{"a": 1 "b": 2}'
+        with patch('json_repair.json.loads', side_effect=json.loads) as loads:
+            result = safe_parse_json(text)
+        self.assertFalse(result['success'])
+        self.assertEqual(loads.call_count, 1)
+        self.assertIn("Expecting ',' delimiter", result['error'])
+
+    def test_failed_comma_repair_not_reparsed(self):
+        """A comma repair that was parsed and failed is not parsed again."""
+        text = '{"a": 1, "b": x,}'
+        with patch('json_repair.json.loads', side_effect=json.loads) as loads:
+            result = safe_parse_json(text)
+        self.assertFalse(result['success'])
+        self.assertEqual(loads.call_count, 2)
+        self.assertIn("Expecting value", result['error'])
+
     def test_parse_invalid_json(self):
         """Completely invalid JSON should fail."""
         text = 'This is not JSON at all'
@@ -192,6 +273,76 @@ class TestSafeParseJson(unittest.TestCase):
         self.assertFalse(result['success'])
 
 
+class TestIncrementalJsonRepair(unittest.TestCase):
+    """Tests for streamed JSON parsing."""
+
+    def _feed_all(self, parser, text, size):
+        return [parser.feed(text[i:i + size]) for i in range(0, len(text), size)]
+
+    def test_returns_data_when_closed(self):
+        """Nothing is returned until the top-level object closes."""
+        text = 'Sure:\n```json\n{"a": ["}", "\\"{"], "b": {"c": 1}}\n```'
+        parser = IncrementalJsonRepair()
+        results = self._feed_all(parser, text, 3)
+        closed = text.index('}}') + 2
+        first = next(i for i, r in enumerate(results) if r is not None)
+        self.assertEqual(first, (closed - 1) // 3)
+        self.assertTrue(all(r is None for r in results[:first]))
+        self.assertEqual(results[first], {"a": ["}", '"{'], "b": {"c": 1}})
+        self.assertEqual(parser.finish()['data'], results[first])
+
+    def test_escape_split_across_chunks(self):
+        """A backslash at a chunk boundary still escapes the next quote."""
+        parser = IncrementalJsonRepair()
+        self.assertIsNone(parser.feed('["ab\\'))
+        self.assertIsNone(parser.feed('"]'))
+        self.assertEqual(parser.feed('"]'), ['ab"]'])
+
+    def test_escapes_at_every_chunk_boundary(self):
+        """Backslash runs and escaped quotes split anywhere parse the same."""
+        text = '{"a": "x\\\\\\"y\\\\", "b": ["\\\\\\\\", "}\\"{"], "c": "\\u00e9"} tail'
+        expected = json.loads(text[:text.index(' tail')])
+        for size in range(1, 8):
+            with self.subTest(size=size):
+                parser = IncrementalJsonRepair()
+                results = [r for r in self._feed_all(parser, text, size) if r is not None]
+                self.assertEqual(results[0], expected)
+
+    def test_long_string_scanned_once(self):
+        """A long string fed in small chunks is not rescanned on every feed."""
+
+        class CountingPattern:
+            def __init__(self, pattern):
+                self.pattern = pattern
+                self.scanned = 0
+
+            def finditer(self, text, pos=0):
+                self.scanned += len(text) - pos
+                return self.pattern.finditer(text, pos)
+
+            def search(self, text, pos=0):
+                self.scanned += len(text) - pos
+                return self.pattern.search(text, pos)
+
+        structural = CountingPattern(json_repair._STRUCTURAL_RE)
+        special = CountingPattern(json_repair._STRING_SPECIAL_RE)
+        text = '{"body": "' + 'x' * 100000 + '"}'
+        parser = IncrementalJsonRepair()
+        with patch.object(json_repair, '_STRUCTURAL_RE', structural), \
+                patch.object(json_repair, '_STRING_SPECIAL_RE', special):
+            results = self._feed_all(parser, text, 50)
+        self.assertEqual(results[-1], {"body": 'x' * 100000})
+        self.assertLessEqual(structural.scanned + special.scanned, 2 * len(text))
+
+    def test_finish_repairs_truncated_stream(self):
+        """A stream that ends early is repaired like safe_parse_json."""
+        parser = IncrementalJsonRepair()
+        self._feed_all(parser, '{"ids": ["a", "b', 4)
+        result = parser.finish()
+        self.assertTrue(result['success'])
+        self.assertEqual(result['data'], {"ids": ["a", "b"]})
+
+
 class TestValidateAnalysisSchema(unittest.TestCase):
     """Tests for schema validation."""
 
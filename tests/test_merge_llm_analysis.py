@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Tests for merging LLM analysis into linkedin_persona.json."""
+
+import json
+import unittest
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "writing-style" / "scripts"))
+
+import merge_llm_analysis
+from merge_llm_analysis import (
+    _short, deep_merge, is_empty_or_placeholder, load_llm_output, merge_positive_examples
+)
+
+
+class TestLoadLlmOutput(unittest.TestCase):
+    """Tests for reading LLM output from a file or stdin."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _write(self, content):
+        path = Path(self.temp_dir.name) / "llm_output.json"
+        path.write_text(content)
+        return str(path)
+
+    def test_plain_json(self):
+        """Plain JSON file is parsed as-is."""
+        source = self._write('{"guardrails": {"never_do": ["x"]}}')
+        with patch('sys.stdout', new=StringIO()):
+            data = load_llm_output(source)
+        self.assertEqual(data, {"guardrails": {"never_do": ["x"]}})
+
+    def test_markdown_fence_stripped(self):
+        """JSON pasted inside a ```json fence is extracted."""
+        source = self._write('```json\n{"voice": {"tone": "dry"}}\n```\n')
+        with patch('sys.stdout', new=StringIO()):
+            data = load_llm_output(source)
+        self.assertEqual(data, {"voice": {"tone": "dry"}})
+
+    def test_utf8_file(self):
+        """Files are decoded as UTF-8 regardless of the default encoding."""
+        path = Path(self.temp_dir.name) / "llm_output.json"
+        path.write_bytes('{"tone": "wry \u2014 understated"}'.encode('utf-8'))
+        with patch('sys.stdout', new=StringIO()):
+            data = load_llm_output(str(path))
+        self.assertEqual(data, {"tone": "wry \u2014 understated"})
+
+    def test_trailing_comma_repaired(self):
+        """Trailing commas are repaired instead of aborting the merge."""
+        with patch('sys.stdin', new=StringIO('{"a": [1, 2,],}')), \
+                patch('sys.stdout', new=StringIO()) as out:
+            data = load_llm_output('-')
+        self.assertEqual(data, {"a": [1, 2]})
+        self.assertIn("repaired", out.getvalue())
+
+    def test_invalid_json_exits(self):
+        """Unrepairable input exits with status 1."""
+        source = self._write('{"a": nope}')
+        with patch('sys.stdout', new=StringIO()) as out:
+            with self.assertRaises(SystemExit) as ctx:
+                load_llm_output(source)
+        self.assertEqual(ctx.exception.code, 1)
+        self.assertIn("Invalid JSON", out.getvalue())
+
+
+class TestDeepMerge(unittest.TestCase):
+    """Tests for merging LLM output into the persona."""
+
+    def _merge(self, base, overlay):
+        with patch('sys.stdout', new=StringIO()):
+            return deep_merge(base, overlay)
+
+    def test_fills_nested_placeholders(self):
+        """Empty values are filled at any depth; existing values are kept."""
+        base = {"voice": {"tone": "", "style": {"pace": None, "mood": "calm"}}}
+        overlay = {"voice": {"tone": "dry", "style": {"pace": "fast", "mood": "loud"}}}
+        merged = self._merge(base, overlay)
+        self.assertEqual(merged, {"voice": {"tone": "dry",
+                                            "style": {"pace": "fast", "mood": "calm"}}})
+
+    def test_base_not_mutated(self):
+        """The caller's persona is left untouched at every level."""
+        base = {
+            "voice": {"style": {"pace": None}},
+            "example_bank": {"positive": [{"text": "hi", "category": ""}]},
+        }
+        overlay = {
+            "voice": {"style": {"pace": "fast"}},
+            "example_bank": {"positive": [{"index": 0, "category": "story"}]},
+        }
+        merged = self._merge(base, overlay)
+        self.assertEqual(merged["voice"]["style"]["pace"], "fast")
+        self.assertEqual(merged["example_bank"]["positive"][0]["category"], "story")
+        self.assertIsNone(base["voice"]["style"]["pace"])
+        self.assertEqual(base["example_bank"]["positive"][0]["category"], "")
+
+    def test_positive_examples_matched_by_index(self):
+        """Annotations land on the indexed example; bad indexes are skipped."""
+        base = {"example_bank": {"positive": [{"text": "a"}, {"text": "b"}]}}
+        overlay = {"example_bank": {"positive": [
+            {"index": 1, "goal": "teach"},
+            {"index": 5, "goal": "ignored"},
+            {"goal": "no index"},
+        ]}}
+        merged = self._merge(base, overlay)
+        self.assertEqual(merged["example_bank"]["positive"],
+                         [{"text": "a"}, {"text": "b", "goal": "teach"}])
+
+    def test_log_written_once_in_order(self):
+        """Merge diagnostics are written in a single call, in merge order."""
+        base = {"voice": {"tone": "", "pace": "slow"}}
+        overlay = {"voice": {"tone": "dry", "pace": "fast"}}
+        with patch('sys.stdout') as out:
+            deep_merge(base, overlay)
+        out.write.assert_called_once_with(
+            '  + voice.tone = "dry"\n'
+            '  ~ voice.pace: keeping existing value (use --force to overwrite)\n'
+        )
+
+    def test_direct_positive_merge_logs_immediately(self):
+        """merge_positive_examples prints its own warnings; none leak into deep_merge."""
+        with patch('sys.stdout', new=StringIO()) as out:
+            merge_positive_examples([{"text": "a"}], [{"goal": "no index"}])
+        self.assertIn("missing 'index'", out.getvalue())
+
+        with patch('sys.stdout', new=StringIO()) as out:
+            deep_merge({"voice": {"tone": ""}}, {"voice": {"tone": "dry"}})
+        self.assertEqual(out.getvalue(), '  + voice.tone = "dry"\n')
+
+
+class TestIsEmptyOrPlaceholder(unittest.TestCase):
+    """Tests for placeholder detection."""
+
+    def test_empty_values(self):
+        for value in [None, "", "   \n", [], {}]:
+            with self.subTest(value=value):
+                self.assertTrue(is_empty_or_placeholder(value))
+
+    def test_real_values(self):
+        """Falsy scalars such as 0 and False are kept as real values."""
+        for value in ["x", [0], {"a": None}, 0, 0.0, False, True, 3]:
+            with self.subTest(value=value):
+                self.assertFalse(is_empty_or_placeholder(value))
+
+
+class TestShort(unittest.TestCase):
+    """Tests for log-line value truncation."""
+
+    def test_matches_truncated_dumps(self):
+        """Output equals json.dumps(value)[:60] without encoding the whole string."""
+        for value in ["a" * 500, 'say "hi" ' * 20, "short", ["x", "y"], 3]:
+            with self.subTest(value=value):
+                self.assertEqual(_short(value), json.dumps(value)[:60])
+
+
+class TestMain(unittest.TestCase):
+    """End-to-end merge of an LLM output file into the persona file."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.persona_file = Path(self.temp_dir.name) / "linkedin_persona.json"
+        self.persona_file.write_text(json.dumps({
+            "schema_version": "2.0",
+            "voice": {"tone": "", "signature_phrases": []},
+            "guardrails": {"never_do": []},
+            "platform_rules": {},
+            "example_bank": {"positive": [], "negative": []},
+        }))
+        self.llm_file = Path(self.temp_dir.name) / "llm_output.json"
+        self.llm_file.write_text(json.dumps({
+            "voice": {"tone": "wry \u2014 understated"},
+            "guardrails": {"never_do": ["hashtags"]},
+        }))
+
+    def _run(self, *args):
+        argv = ["merge_llm_analysis.py", *args, str(self.llm_file)]
+        with patch.object(merge_llm_analysis, "PERSONA_FILE", self.persona_file), \
+                patch("sys.argv", argv), patch("sys.stdout", new=StringIO()):
+            return merge_llm_analysis.main()
+
+    def test_writes_merged_persona(self):
+        """Merged persona is written as indented, ASCII-escaped JSON."""
+        self.assertEqual(self._run(), 0)
+        content = self.persona_file.read_text(encoding="ascii")
+        merged = json.loads(content)
+        self.assertEqual(content, json.dumps(merged, indent=2))
+        self.assertEqual(merged["voice"]["tone"], "wry \u2014 understated")
+        self.assertEqual(merged["guardrails"]["never_do"], ["hashtags"])
+
+    def test_non_ascii_persona_serialized_once(self):
+        """A non-ASCII persona is written by json.dumps alone, not orjson first."""
+        import ingest
+
+        with patch.object(ingest.json, 'dumps', wraps=json.dumps) as json_dumps:
+            if ingest.ORJSON_AVAILABLE:
+                with patch.object(ingest.orjson, 'dumps', wraps=ingest.orjson.dumps) as orjson_dumps:
+                    self.assertEqual(self._run(), 0)
+                # Only _copy_json's compact round trip may use orjson
+                self.assertFalse([c for c in orjson_dumps.call_args_list if 'option' in c.kwargs])
+            else:
+                self.assertEqual(self._run(), 0)
+        indented = [c for c in json_dumps.call_args_list if c.kwargs.get('indent') == 2]
+        self.assertEqual(len(indented), 1)
+
+    def test_dry_run_leaves_file(self):
+        """--dry-run does not touch the persona file."""
+        before = self.persona_file.read_text()
+        self.assertEqual(self._run("--dry-run"), 0)
+        self.assertEqual(self.persona_file.read_text(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""Tests for batch preparation (prepare_batch.py)."""
+
+import base64
+import json
+import unittest
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "writing-style" / "scripts"))
+
+import prepare_batch
+
+
+def _b64(text):
+    return base64.urlsafe_b64encode(text.encode('utf-8')).decode('ascii')
+
+
+class PrepareBatchTestCase(unittest.TestCase):
+    """Points prepare_batch at a temporary data directory."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.data_dir = Path(self.temp_dir.name)
+        paths = {
+            'CLUSTERS_FILE': self.data_dir / "clusters.json",
+            'ENRICHED_DIR': self.data_dir / "enriched_samples",
+            'RAW_DIR': self.data_dir / "raw_samples",
+            'BATCHES_DIR': self.data_dir / "batches",
+            'SAMPLES_DIR': self.data_dir / "samples",
+            'ANALYZED_INDEX_FILE': self.data_dir / ".analyzed_index.json",
+        }
+        for name, path in paths.items():
+            patcher = patch.object(prepare_batch, name, path)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        for name in ('ENRICHED_DIR', 'BATCHES_DIR', 'SAMPLES_DIR'):
+            paths[name].mkdir()
+
+    def write_json(self, relpath, data):
+        path = self.data_dir / relpath
+        path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        return path
+
+    def write_enriched(self, email_id, body="Hello", subject="Subj"):
+        self.write_json(f"enriched_samples/{email_id}.json", {
+            'original_data': {
+                'id': email_id,
+                'payload': {
+                    'headers': [{'name': 'Subject', 'value': subject},
+                                {'name': 'To', 'value': 'team@example.com'}],
+                    'body': {'data': _b64(body)},
+                },
+            },
+            'enrichment': {'recipient_type': 'individual', 'audience': 'internal',
+                           'thread_position': 'reply'},
+            'quality': {'score': 0.5},
+        })
+
+
+class TestLoadJsonFile(PrepareBatchTestCase):
+    """Tests for JSON file loading."""
+
+    def test_reads_utf8(self):
+        path = self.write_json("clusters.json", {"name": "café"})
+        self.assertEqual(prepare_batch.load_json_file(path), {"name": "café"})
+
+    def test_invalid_json_raises_decode_error(self):
+        path = self.data_dir / "bad.json"
+        path.write_text("{not json")
+        with self.assertRaises(json.JSONDecodeError):
+            prepare_batch.load_json_file(path)
+
+
+class TestLoadCalibration(unittest.TestCase):
+    """Tests for the calibration reference."""
+
+    def test_read_once(self):
+        prepare_batch.load_calibration.cache_clear()
+        self.addCleanup(prepare_batch.load_calibration.cache_clear)
+        with patch('builtins.open', wraps=open) as opener:
+            first = prepare_batch.load_calibration()
+            second = prepare_batch.load_calibration()
+        self.assertIs(first, second)
+        self.assertIn("Calibration", first)
+        self.assertLessEqual(opener.call_count, 1)
+
+
+class TestExtractBody(unittest.TestCase):
+    """Tests for plain-text body extraction."""
+
+    def test_nested_plain_part(self):
+        email = {'payload': {'parts': [
+            {'mimeType': 'text/html', 'body': {'data': _b64('<p>html</p>')}},
+            {'mimeType': 'multipart/alternative', 'parts': [
+                {'mimeType': 'text/plain', 'body': {'data': _b64('caf\u00e9 body')}},
+            ]},
+        ]}}
+        self.assertEqual(prepare_batch.extract_body(email), 'caf\u00e9 body')
+
+    def test_earlier_nested_part_wins(self):
+        """A nested plain part beats a later shallower one (document order)."""
+        email = {'payload': {'parts': [
+            {'mimeType': 'multipart/mixed', 'parts': [
+                {'mimeType': 'text/plain', 'body': {'data': ''}},
+                {'mimeType': 'multipart/alternative', 'parts': [
+                    {'mimeType': 'text/plain', 'body': {'data': _b64('deep')}},
+                ]},
+            ]},
+            {'mimeType': 'text/plain', 'body': {'data': _b64('shallow')}},
+        ]}}
+        self.assertEqual(prepare_batch.extract_body(email), 'deep')
+
+    def test_falls_back_to_stdlib_base64(self):
+        email = {'payload': {'body': {'data': _b64('plain body')}}}
+        with patch.object(prepare_batch, 'PYBASE64_AVAILABLE', False):
+            self.assertEqual(prepare_batch.extract_body(email), 'plain body')
+
+    def test_undecodable_body_uses_snippet(self):
+        bad_utf8 = base64.urlsafe_b64encode(b'\xff\xfe').decode('ascii')
+        email = {'snippet': 'snip', 'payload': {'body': {'data': bad_utf8}}}
+        self.assertEqual(prepare_batch.extract_body(email), 'snip')
+
+
+class TestFormatEmailForAnalysis(unittest.TestCase):
+    """Tests for per-email formatting."""
+
+    def test_headers_case_insensitive_first_wins(self):
+        email = {'payload': {'headers': [
+            {'name': 'X-Other', 'value': 'x'},
+            {'name': 'SUBJECT', 'value': 'First'},
+            {'name': 'Subject', 'value': 'Second'},
+            {'name': 'to', 'value': 'a@example.com, ' * 20},
+        ], 'body': {'data': _b64('hi')}}}
+        formatted = prepare_batch.format_email_for_analysis('email_1', email)
+        self.assertEqual(formatted['subject'], 'First')
+        self.assertEqual(formatted['subject'], prepare_batch.get_header(email, 'subject'))
+        self.assertEqual(len(formatted['to']), 100)
+        self.assertEqual(formatted['body'], 'hi')
+
+    def test_missing_headers(self):
+        formatted = prepare_batch.format_email_for_analysis('email_1', {'snippet': 's'})
+        self.assertEqual((formatted['subject'], formatted['to']), ('', ''))
+
+
+class TestLoadClusterData(PrepareBatchTestCase):
+    """Tests for loading clusters.json."""
+
+    def test_missing_file(self):
+        self.assertIsNone(prepare_batch.load_cluster_data())
+
+    def test_parsed_once_until_changed(self):
+        self.write_json("clusters.json", {"clusters": [{"id": 0}]})
+        with patch.object(prepare_batch, 'load_json_file',
+                          wraps=prepare_batch.load_json_file) as loader:
+            first = prepare_batch.load_cluster_data()
+            self.assertIs(prepare_batch.load_cluster_data(), first)
+            self.assertEqual(loader.call_count, 1)
+
+            self.write_json("clusters.json", {"clusters": [{"id": 0}, {"id": 1}]})
+            self.assertEqual(len(prepare_batch.load_cluster_data()['clusters']), 2)
+
+
+class TestGetAnalyzedIds(PrepareBatchTestCase):
+    """Tests for collecting already-analyzed email IDs."""
+
+    def test_samples_and_batches(self):
+        """IDs come from sample file names and batch sample entries."""
+        (self.data_dir / "samples" / "email_a.json").write_text("{}")
+        self.write_json("batches/batch_001.json", {"samples": [{"id": "email_b"}]})
+        self.write_json("batches/notes.json", {"samples": [{"id": "email_c"}]})
+        (self.data_dir / "batches" / "batch_002.json").write_text("{broken")
+        self.assertEqual(prepare_batch.get_analyzed_ids(), {"email_a", "email_b"})
+
+    def test_samples_without_id_skipped(self):
+        self.write_json("batches/batch_001.json",
+                        {"samples": [{"id": "email_a"}, {"persona": "P"}, {"id": ""}]})
+        self.assertEqual(prepare_batch.get_analyzed_ids(), {"email_a"})
+
+    def test_cached_until_files_change(self):
+        """Repeat calls reuse the parsed batches until a batch or sample changes."""
+        self.write_json("batches/batch_001.json", {"samples": [{"id": "email_b"}]})
+        with patch.object(prepare_batch, '_read_batch_ids',
+                          wraps=prepare_batch._read_batch_ids) as reader:
+            first = prepare_batch.get_analyzed_ids()
+            first.add("mutated")
+            self.assertEqual(prepare_batch.get_analyzed_ids(), {"email_b"})
+            self.assertEqual(reader.call_count, 1)
+
+            self.write_json("batches/batch_001.json",
+                            {"samples": [{"id": "email_b"}, {"id": "email_bb"}]})
+            self.assertEqual(prepare_batch.get_analyzed_ids(), {"email_b", "email_bb"})
+
+        (self.data_dir / "samples" / "email_s.json").write_text("{}")
+        self.assertIn("email_s", prepare_batch.get_analyzed_ids())
+
+    def test_index_reused_across_runs(self):
+        """Only batch files added or changed since the last run are parsed."""
+        self.write_json("batches/batch_001.json", {"samples": [{"id": "email_a"}]})
+        self.write_json("batches/batch_002.json", {"samples": [{"id": "email_b"}]})
+        prepare_batch.get_analyzed_ids()
+        self.assertTrue(prepare_batch.ANALYZED_INDEX_FILE.exists())
+
+        # A new run: the in-process cache is gone, the index file is not
+        prepare_batch._analyzed_ids_cached.cache_clear()
+        self.write_json("batches/batch_003.json", {"samples": [{"id": "email_c"}]})
+        with patch.object(prepare_batch, '_read_batch_ids',
+                          wraps=prepare_batch._read_batch_ids) as reader:
+            ids = prepare_batch.get_analyzed_ids()
+        self.assertEqual(ids, {"email_a", "email_b", "email_c"})
+        reader.assert_called_once_with(prepare_batch.BATCHES_DIR / "batch_003.json")
+
+    def test_corrupt_index_ignored(self):
+        self.write_json("batches/batch_001.json", {"samples": [{"id": "email_a"}]})
+        prepare_batch.ANALYZED_INDEX_FILE.write_text("{garbage")
+        self.assertEqual(prepare_batch.get_analyzed_ids(), {"email_a"})
+
+
+class TestPrepareClusterBatch(PrepareBatchTestCase):
+    """Tests for formatting a cluster batch."""
+
+    def setUp(self):
+        super().setUp()
+        self.write_json("clusters.json", {"clusters": [
+            {"id": 0, "size": 3, "sample_ids": ["email_1", "email_2", "email_3"],
+             "centroid_emails": ["email_1"]},
+        ]})
+
+    def test_formats_unanalyzed_emails(self):
+        """Analyzed and missing emails are left out of the batch."""
+        self.write_enriched("email_1", body="first body")
+        self.write_enriched("email_2", body="second body", subject="Second")
+        self.write_json("batches/batch_001.json", {"samples": [{"id": "email_1"}]})
+        with patch('sys.stdout'):
+            output = prepare_batch.prepare_cluster_batch(0)
+        self.assertNotIn("first body", output)
+        self.assertIn("## Email 1: email_2", output)
+        self.assertIn("**Subject:** Second", output)
+        self.assertIn("second body", output)
+        self.assertNotIn("email_3\n", output)
+        self.assertIn("**Unanalyzed:** 1 emails", output)
+
+
+class TestClusterCoverage(PrepareBatchTestCase):
+    """Tests for per-cluster coverage checks."""
+
+    def setUp(self):
+        super().setUp()
+        self.write_json("clusters.json", {"clusters": [
+            {"id": 0, "size": 10, "sample_ids": [f"email_0{i}" for i in range(10)]},
+            {"id": 1, "size": 10, "sample_ids": [f"email_1{i}" for i in range(10)]},
+            {"id": -1, "size": 2, "sample_ids": ["email_n0", "email_n1"], "is_noise": True},
+            {"id": 2, "size": 4, "sample_ids": [f"email_2{i}" for i in range(4)]},
+        ]})
+
+    def test_incomplete_clusters_before_target(self):
+        """Started clusters under 80% coverage are flagged; others are not."""
+        analyzed = {f"email_0{i}" for i in range(3)} | {f"email_1{i}" for i in range(9)}
+        self.assertEqual(prepare_batch.check_incomplete_clusters(2, analyzed),
+                         [(0, 7, 0.3)])
+        self.assertEqual(prepare_batch.check_incomplete_clusters(0, analyzed), [])
+
+    def test_coverage_counts_in_status(self):
+        (self.data_dir / "samples" / "email_00.json").write_text("{}")
+        self.write_json("batches/batch_001.json",
+                        {"samples": [{"id": f"email_2{i}"} for i in range(4)]})
+        with patch('sys.stdout', new=StringIO()) as out:
+            prepare_batch.show_coverage_calculation()
+        report = out.getvalue()
+        self.assertIn("Cluster 0: 10 emails -> Need 8 (1 done, 10%)", report)
+        self.assertIn("Cluster 2: 4 emails -> Need 4 (4 done, 100%)", report)
+        self.assertIn("CURRENT: 5 analyzed", report)
+
+
+class TestPrepareLegacyBatch(PrepareBatchTestCase):
+    """Tests for legacy (unclustered) batches."""
+
+    def test_keeps_file_order_and_skips_unreadable(self):
+        """Emails appear in directory order; unreadable files are skipped."""
+        for i in range(1, 6):
+            self.write_enriched(f"email_{i}", body=f"body {i}")
+        (self.data_dir / "enriched_samples" / "email_3.json").write_text("{broken")
+        output = prepare_batch.prepare_legacy_batch(count=10)
+        listed = [p.stem for p in prepare_batch.ENRICHED_DIR.glob("email_*.json")
+                  if p.stem != "email_3"]
+        positions = [output.index(f"## Email {n}: {eid}\n")
+                     for n, eid in enumerate(listed, 1)]
+        self.assertEqual(positions, sorted(positions))
+        self.assertNotIn("body 3", output)
+        self.assertIn("# Batch Analysis (4 emails)", output)
+
+if __name__ == "__main__":
+    unittest.main()
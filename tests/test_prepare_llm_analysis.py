@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for exporting LinkedIn posts for LLM analysis."""
+
+import json
+import unittest
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "writing-style" / "scripts"))
+
+import prepare_llm_analysis
+from prepare_llm_analysis import generate_output, load_persona, load_posts, write_output
+
+
+class PrepareLlmAnalysisTestCase(unittest.TestCase):
+    """Points the script's data paths at a temporary directory."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        root = Path(self.temp_dir.name)
+        self.filtered_dir = root / "filtered_samples"
+        self.filtered_dir.mkdir()
+        self.persona_file = root / "linkedin_persona.json"
+
+        for name, value in [("FILTERED_DIR", self.filtered_dir),
+                            ("PERSONA_FILE", self.persona_file)]:
+            patcher = patch.object(prepare_llm_analysis, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write_post(self, name, post):
+        (self.filtered_dir / name).write_text(json.dumps(post))
+
+
+class TestLoadPosts(PrepareLlmAnalysisTestCase):
+    """Tests for loading filtered posts."""
+
+    def test_sorted_by_date(self):
+        """Posts come back oldest first; undated posts sort first."""
+        self.write_post("linkedin_a.json", {"text": "new", "date_posted": "2024-05-01"})
+        self.write_post("linkedin_b.json", {"text": "old", "date_posted": "2023-01-01"})
+        self.write_post("linkedin_c.json", {"text": "undated"})
+        self.write_post("other.json", {"text": "ignored", "date_posted": "2020-01-01"})
+        self.assertEqual([p["text"] for p in load_posts()], ["undated", "old", "new"])
+
+    def test_bad_file_skipped(self):
+        """Unparseable files are reported and skipped."""
+        self.write_post("linkedin_a.json", {"text": "ok"})
+        (self.filtered_dir / "linkedin_b.json").write_text("{nope")
+        with patch('sys.stdout', new=StringIO()) as out:
+            posts = load_posts()
+        self.assertEqual(posts, [{"text": "ok"}])
+        self.assertIn("linkedin_b.json", out.getvalue())
+
+    def test_utf8_post(self):
+        """Posts are decoded as UTF-8 regardless of the default encoding."""
+        (self.filtered_dir / "linkedin_a.json").write_bytes(
+            '{"text": "café — ok"}'.encode('utf-8'))
+        self.assertEqual(load_posts(), [{"text": "café — ok"}])
+
+    def test_missing_dir(self):
+        """A missing filtered_samples directory yields no posts."""
+        self.filtered_dir.rmdir()
+        self.assertEqual(load_posts(), [])
+
+
+class TestLoadPersona(PrepareLlmAnalysisTestCase):
+    """Tests for loading the auto-extracted persona."""
+
+    def test_loads_persona(self):
+        self.persona_file.write_text(json.dumps({"voice": {"tone": "dry"}}))
+        self.assertEqual(load_persona(), {"voice": {"tone": "dry"}})
+
+    def test_missing_persona(self):
+        self.assertEqual(load_persona(), {})
+
+
+class TestWriteOutput(unittest.TestCase):
+    """Tests for rendering the analysis input document."""
+
+    POSTS = [
+        {"text": "First post", "likes": 3, "date_posted": "2024-01-02T08:00:00Z",
+         "top_comments": [{"user_name": "Ann", "comment": "Nice"}]},
+        {"text": "Second post", "content_type": "article"},
+    ]
+
+    def test_streams_same_document(self):
+        """Writing to a file handle matches the string output and reports its length."""
+        with patch.object(prepare_llm_analysis, "datetime") as fake_datetime:
+            fake_datetime.now.return_value.strftime.return_value = "2024-06-01 12:00"
+            fake_datetime.fromisoformat = prepare_llm_analysis.datetime.fromisoformat
+            out = StringIO()
+            size = write_output(out, self.POSTS, {"voice": {}}, "# Guide")
+            expected = generate_output(self.POSTS, {"voice": {}}, "# Guide")
+        self.assertEqual(out.getvalue(), expected)
+        self.assertEqual(size, len(expected))
+
+    def test_sections_in_order(self):
+        """Guide, persona, posts and footer appear in that order."""
+        output = generate_output(self.POSTS, {"voice": {"tone": "dry"}}, "# Guide")
+        markers = ["# Guide", '"tone": "dry"', "### Post 1 of 2 (index: 0)",
+                   "### Post 2 of 2 (index: 1)", "**Type:** article", "## Your Task"]
+        positions = [output.index(marker) for marker in markers]
+        self.assertEqual(positions, sorted(positions))
+        self.assertIn('- "Nice" \u2014 Ann', output)
+        self.assertTrue(output.endswith("generic advice isn't helpful\n"))
+
+
+class TestMain(PrepareLlmAnalysisTestCase):
+    """End-to-end export of posts to the analysis input file."""
+
+    def test_writes_utf8_file(self):
+        self.write_post("linkedin_a.json", {"text": "caf\u00e9 \U0001F680", "date_posted": "2024-01-01"})
+        output_file = Path(self.temp_dir.name) / "out.md"
+        argv = ["prepare_llm_analysis.py", "--output", str(output_file)]
+        with patch("sys.argv", argv), patch("sys.stdout", new=StringIO()) as out:
+            self.assertEqual(prepare_llm_analysis.main(), 0)
+        content = output_file.read_text(encoding="utf-8")
+        self.assertIn("caf\u00e9 \U0001F680", content)
+        self.assertIn(f"File size: {len(content):,} characters", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
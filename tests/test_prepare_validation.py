@@ -3,9 +3,13 @@
 Unit Tests - Validation Preparation (contraction detection, tone analysis)
 """
 
+import json
 import sys
+import tempfile
 import unittest
+from io import StringIO
 from pathlib import Path
+from unittest.mock import patch
 
 # Add skill scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "writing-style" / "scripts"))
@@ -143,5 +147,86 @@ class TestToneAnalysis(unittest.TestCase):
         self.assertIn('concise', hints)
 
 
+class TestExtractQuotedAndReply(unittest.TestCase):
+    """Test splitting an email body into quoted context and reply."""
+
+    def test_blank_line_between_quotes_kept_in_quote(self):
+        body = "Sounds good.\n\nOn Mon, Ann wrote:\n> First\n\n> Second"
+        quoted, reply = prepare_validation.extract_quoted_and_reply(body)
+        self.assertEqual(quoted, "First\n\nSecond")
+        self.assertEqual(reply, "Sounds good.")
+
+    def test_blank_line_ends_quote_block(self):
+        """Text after a blank line that is not quoted is reply again."""
+        body = "> Can we meet?\nunmarked quote\n\nYes, Tuesday works.\n\n| Old"
+        quoted, reply = prepare_validation.extract_quoted_and_reply(body)
+        self.assertEqual(quoted, "Can we meet?\nunmarked quote\nOld")
+        self.assertEqual(reply, "Yes, Tuesday works.")
+
+    def test_empty_body(self):
+        self.assertEqual(prepare_validation.extract_quoted_and_reply(""), ("", ""))
+
+
+class TestGreetingAndClosing(unittest.TestCase):
+    """Test greeting and closing extraction."""
+
+    def test_greeting_and_closing(self):
+        result = prepare_validation.extract_greeting_and_closing(
+            "hey team,\nThe draft is attached.\nCheers,\n- John")
+        self.assertEqual(result, {"greeting": "hey team,", "closing": "- John"})
+
+    def test_no_greeting_or_closing(self):
+        result = prepare_validation.extract_greeting_and_closing(
+            "The draft is attached.\nIt covers the Q3 numbers.")
+        self.assertEqual(result, {"greeting": "", "closing": ""})
+
+
+class TestProcessValidationEmail(unittest.TestCase):
+    """Test reading a validation email into a context/reply pair."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _write(self, name, content):
+        path = Path(self.temp_dir.name) / name
+        path.write_bytes(content.encode('utf-8'))
+        return path
+
+    def test_builds_pair(self):
+        """Quoted text becomes context; the rest is the ground truth reply."""
+        path = self._write("email_abc.json", json.dumps({
+            "body": "Hi Ann,\nSounds good \u2014 see you then.\n\n> Can we meet?",
+            "subject": "Meeting",
+            "to": "ann@example.com",
+        }))
+        pair = prepare_validation.process_validation_email(path)
+        self.assertEqual(pair["id"], "email_abc")
+        self.assertEqual(pair["context"]["quoted_text"], "Can we meet?")
+        self.assertEqual(pair["ground_truth"]["reply_text"],
+                         "Hi Ann,\nSounds good \u2014 see you then.")
+        self.assertEqual(pair["ground_truth"]["greeting"], "Hi Ann,")
+
+    def test_invalid_json_skipped(self):
+        """Unparseable files are reported and skipped."""
+        path = self._write("email_bad.json", '{"body": ')
+        with patch('sys.stdout', new=StringIO()) as out:
+            self.assertIsNone(prepare_validation.process_validation_email(path))
+        self.assertIn("email_bad.json", out.getvalue())
+
+
+class TestListValidationFiles(unittest.TestCase):
+    """Test listing the validation set."""
+
+    def test_json_files_sorted_by_name(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for name in ["email_b.json", "email_a.json", "notes.txt"]:
+                (root / name).write_text("{}")
+            with patch.object(prepare_validation, "VALIDATION_DIR", root):
+                files = prepare_validation.list_validation_files()
+        self.assertEqual(files, [root / "email_a.json", root / "email_b.json"])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -158,6 +158,42 @@ class TestPreflightCheck(unittest.TestCase):
         finally:
             sys.path.pop(0)
 
+    def test_preflight_reports_in_check_order(self):
+        """Concurrent checks are still reported in the listed order."""
+        import io
+        import time
+        from unittest.mock import patch
+
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        try:
+            import preflight_check
+        finally:
+            sys.path.pop(0)
+
+        def slow_python():
+            time.sleep(0.05)
+            return True, "slow"
+
+        def broken_npx():
+            raise RuntimeError("boom")
+
+        ok = lambda: (True, "ok")
+        with patch.multiple(preflight_check, check_python=slow_python, check_venv=ok,
+                            check_npx=broken_npx, check_dependencies=ok,
+                            check_data_dir=ok), \
+                patch('sys.stdout', new=io.StringIO()) as out:
+            self.assertFalse(preflight_check.run_preflight())
+
+        lines = [line for line in out.getvalue().splitlines()
+                 if line.startswith(("[OK]", "[ERROR]"))]
+        self.assertEqual(lines, [
+            "[OK] Python: slow",
+            "[OK] Virtual Env: ok",
+            "[ERROR] NPX: Check failed: boom",
+            "[OK] Dependencies: ok",
+            "[OK] Data Directory: ok",
+        ])
+
 
 if __name__ == "__main__":
     unittest.main()